@@ -0,0 +1,21 @@
+"""Argon2 password hashing and HMAC token helpers."""
+
+from .auth import (
+    ahash_password,
+    averify_credential,
+    hash_password,
+    hash_token,
+    set_password_hasher,
+    verify_credential,
+    verify_token,
+)
+
+__all__ = [
+    "ahash_password",
+    "averify_credential",
+    "hash_password",
+    "hash_token",
+    "set_password_hasher",
+    "verify_credential",
+    "verify_token",
+]
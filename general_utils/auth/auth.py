@@ -1,5 +1,42 @@
+import asyncio
+import hashlib
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
 from argon2 import PasswordHasher
 
+# Shared hasher; PasswordHasher is stateless after construction and thread-safe.
+_PH = PasswordHasher()
+
+# Argon2 is CPU-bound, so async helpers run it on a pool capped at the core count.
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1, thread_name_prefix="argon2"
+        )
+    return _executor
+
+
+def set_password_hasher(hasher: PasswordHasher) -> None:
+    """
+    Replace the shared PasswordHasher used by the auth helpers.
+
+    Use this to configure ``time_cost``, ``memory_cost`` or ``parallelism``
+    once at startup instead of on every call.
+
+    Args:
+        hasher (PasswordHasher): The configured hasher instance.
+
+    """
+    global _PH
+    _PH = hasher
+
 
 def hash_password(password: str) -> str:
     """
@@ -8,8 +45,7 @@ def hash_password(password: str) -> str:
     :param password: The password to hash.
     :return: The hashed password.
     """
-    ph = PasswordHasher()
-    return ph.hash(password)
+    return _PH.hash(password)
 
 
 def verify_credential(password: str, hashed_password: str) -> bool:
@@ -20,9 +56,60 @@ def verify_credential(password: str, hashed_password: str) -> bool:
     :param hashed_password: The hashed password to verify against.
     :return: True if the password matches the hashed password, False otherwise.
     """
-    ph = PasswordHasher()
     try:
-        return ph.verify(hashed_password, password)
+        return _PH.verify(hashed_password, password)
     except Exception as e:
         print(f"Error verifying password: {e}")
         return False
+
+
+async def ahash_password(password: str) -> str:
+    """
+    Hash a password using Argon2 without blocking the event loop.
+
+    :param password: The password to hash.
+    :return: The hashed password.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), hash_password, password)
+
+
+async def averify_credential(password: str, hashed_password: str) -> bool:
+    """
+    Verify a password against a hashed password without blocking the event loop.
+
+    :param password: The plain text password to verify.
+    :param hashed_password: The hashed password to verify against.
+    :return: True if the password matches the hashed password, False otherwise.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_executor(), verify_credential, password, hashed_password
+    )
+
+
+def hash_token(token: str, key: bytes) -> str:
+    """
+    Hash a high-entropy token (API key, session id) with HMAC-SHA256.
+
+    Use this instead of Argon2 for random machine-generated secrets: they cannot
+    be brute-forced, so a memory-hard KDF only adds latency. Keep Argon2
+    (``hash_password``) for user-chosen passwords.
+
+    :param token: The token to hash.
+    :param key: Server-side secret key for the HMAC.
+    :return: The hex-encoded MAC.
+    """
+    return hmac.new(key, token.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def verify_token(token: str, key: bytes, token_hash: str) -> bool:
+    """
+    Verify a token against a MAC produced by ``hash_token`` in constant time.
+
+    :param token: The token to verify.
+    :param key: Server-side secret key used when hashing.
+    :param token_hash: The stored hex-encoded MAC.
+    :return: True if the token matches, False otherwise.
+    """
+    return hmac.compare_digest(hash_token(token, key), token_hash)
@@ -1,28 +1,143 @@
 import dataclasses
+import fnmatch
 import functools
-import hashlib
 import json
 import logging  # noqa: TID251
+import time
+from collections import OrderedDict
 from datetime import date, datetime
 from enum import Enum
 from typing import Any, Callable, Optional
 
+import orjson
 import redis.asyncio as redis
 from fastapi import Request
 from pydantic import BaseModel
+from xxhash import xxh3_128_hexdigest
 
 logger = logging.getLogger(__name__)
 
+# SCAN page size and max keys per UNLINK when clearing the cache in bulk.
+_DELETE_BATCH_SIZE = 500
+
+# Methods whose cache key is derived from the request body.
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+# HSET a group field and give the hash a TTL only if it has none yet, so a busy
+# group still expires on the first write's deadline. Equivalent to EXPIRE NX,
+# which needs Redis 7; the TTL check keeps this working on older servers.
+_HSET_EXPIRE_IF_PERSISTENT = """
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+if redis.call('TTL', KEYS[1]) == -1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[3])
+end
+"""
+
+
+def _default_serializer(o: Any) -> Any:
+    # Pydantic BaseModel: embed pydantic-core's JSON output as-is
+    if isinstance(o, BaseModel):
+        return orjson.Fragment(o.__pydantic_serializer__.to_json(o))
+    # Set
+    if isinstance(o, set):
+        return list(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def _json_default(o: Any) -> Any:
+    # stdlib fallback covering the types orjson handles natively
+    if isinstance(o, BaseModel):
+        return o.model_dump(mode="json")
+    if dataclasses.is_dataclass(o):
+        return dataclasses.asdict(o)
+    if isinstance(o, Enum):
+        return o.value
+    if isinstance(o, datetime | date):
+        return o.isoformat()
+    if isinstance(o, set):
+        return list(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def _dumps(obj: Any) -> bytes:
+    # Top-level models skip orjson entirely (model_dump_json without the decode)
+    if isinstance(obj, BaseModel):
+        return obj.__pydantic_serializer__.to_json(obj)
+    try:
+        return orjson.dumps(
+            obj,
+            default=_default_serializer,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+    except orjson.JSONEncodeError:
+        # e.g. ints beyond 64 bits; the stdlib encoder handles those
+        return json.dumps(
+            obj,
+            default=_json_default,
+            ensure_ascii=False,
+            sort_keys=True,
+            separators=(",", ":"),
+        ).encode()
+
+
+class _LocalTTLCache:
+    """Tiny in-process LRU with per-entry expiry, used as L1 in front of Redis."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._data: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[bytes]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        for key in [k for k in self._data if k.startswith(prefix)]:
+            del self._data[key]
+
+    def delete_matching(self, pattern: str) -> None:
+        for key in [k for k in self._data if fnmatch.fnmatchcase(k, pattern)]:
+            del self._data[key]
+
 
 class RedisCache:
-    def __init__(self, redis_url: str, prefix: str = "cache", default_expire: int = 60):
+    def __init__(
+        self,
+        redis_url: str,
+        prefix: str = "cache",
+        default_expire: int = 60,
+        local_max: int = 0,
+        local_ttl: Optional[int] = None,
+    ):
         """
         Initialize Redis cache.
 
         Args:
             redis_url (str): The Redis connection URL.
             prefix (str): The prefix for cache.
-            default_expire (str): Cache expiration time.
+            default_expire (int): Cache expiration time in seconds.
+            local_max (int): Max entries in the in-process L1 cache checked before
+                Redis. 0 (default) disables it. Entries are per process, so
+                clearing the cache only evicts them from the calling process.
+            local_ttl (Optional[int]): L1 entry lifetime in seconds, capped by the
+                expiry the entry was cached with (not its remaining Redis TTL).
+                Defaults to default_expire.
 
         Example:
             ```
@@ -80,13 +195,19 @@ class RedisCache:
         self.redis_url = redis_url
         self.prefix = prefix
         self.default_expire = default_expire
+        self._key_prefix = f"{prefix}:"
+        self.local_ttl = local_ttl or default_expire
+        self._local = _LocalTTLCache(local_max) if local_max > 0 else None
         self.redis = None
+        self._hset_expire_if_persistent = None
 
     async def init(self):
         """Initialize Redis connection."""
         try:
-            self.redis = await redis.from_url(
-                self.redis_url, encoding="utf-8", decode_responses=True
+            # Values stay bytes end-to-end: orjson writes and reads bytes directly
+            self.redis = await redis.from_url(self.redis_url)
+            self._hset_expire_if_persistent = self.redis.register_script(
+                _HSET_EXPIRE_IF_PERSISTENT
             )
         except Exception as e:
             logger.warning(f"Failed to initialize Redis connection: {e}")
@@ -96,47 +217,31 @@ class RedisCache:
         """Close Redis connection."""
         if self.redis:
             await self.redis.close()
+            self.redis = None
 
-    def _serialize_to_json(self, obj: Any) -> str:
+    def _serialize_to_json(self, obj: Any) -> bytes:
         """
-        Serialize object to JSON string, handling complex types.
+        Serialize object to JSON bytes, handling complex types.
 
         Supports:
             - Pydantic BaseModel
-            - dataclasses
-            - Enum
-            - datetime/date
+            - dataclasses, Enum, datetime/date (natively by orjson)
+            - Set
             - Standard JSON types
         """
-
-        def default_serializer(o):
-            # Pydantic BaseModel
-            if isinstance(o, BaseModel):
-                return o.model_dump()
-            # dataclass
-            if dataclasses.is_dataclass(o):
-                return dataclasses.asdict(o)
-            # Enum
-            if isinstance(o, Enum):
-                return o.value
-            # datetime/date
-            if isinstance(o, datetime | date):
-                return o.isoformat()
-            # Set
-            if isinstance(o, set):
-                return list(o)
-            raise TypeError(
-                f"Object of type {type(o).__name__} is not JSON serializable"
-            )
-
-        return json.dumps(
-            obj, default=default_serializer, ensure_ascii=False, sort_keys=True
-        )
+        return _dumps(obj)
 
     def _hash_body(self, body: Any) -> str:
-        """Hash body to create a unique key for POST/PUT."""
-        body_str = self._serialize_to_json(body)
-        return hashlib.sha256(body_str.encode("utf-8")).hexdigest()
+        """
+        Hash body to create a unique key for POST/PUT.
+
+        Uses 128-bit XXH3: cache keys only need collision resistance, not a
+        cryptographic digest, and XXH3 is an order of magnitude faster than SHA-256.
+        """
+        if isinstance(body, bytes | bytearray | memoryview):
+            # Raw request bodies are hashed as-is, without a JSON round-trip
+            return xxh3_128_hexdigest(body)
+        return xxh3_128_hexdigest(self._serialize_to_json(body))
 
     def _build_key(
         self,
@@ -145,41 +250,112 @@ class RedisCache:
         body: Any = None,
     ) -> str:
         # If POST/PUT/PATCH and has body → hash into key
-        if (
-            request
-            and isinstance(request, Request)
-            and request.method in {"POST", "PUT", "PATCH"}
-            and body is not None
-        ):
+        if body is not None and request is not None and request.method in _BODY_METHODS:
             body_hash = self._hash_body(body)
-            return f"{self.prefix}:{request.url.path}:{body_hash}"
+            return self._key_prefix + request.url.path + ":" + body_hash
 
         if custom_key and not body:
-            return f"{self.prefix}:{custom_key}"
+            return self._key_prefix + custom_key
 
         if custom_key and body:
             body_hash = self._hash_body(body)
-            return f"{self.prefix}:{custom_key}:{body_hash}"
+            return self._key_prefix + custom_key + ":" + body_hash
 
         # Default GET key by path + query
-        return f"{self.prefix}:{request.url.path}?{request.url.query}"
+        url = request.url
+        return self._key_prefix + url.path + "?" + url.query
+
+    async def _cached_call(
+        self,
+        cache_key: str,
+        expire_seconds: Optional[int],
+        func: Callable,
+        args: tuple,
+        kwargs: dict,
+        group_key: Optional[str] = None,
+    ) -> Any:
+        """
+        Return the cached result for cache_key, or call func and cache it.
+
+        With group_key, the entry is stored as field cache_key of that Redis hash.
+        """
+        ttl = expire_seconds or self.default_expire
+        local = self._local
+        local_key = cache_key if group_key is None else f"{group_key}|{cache_key}"
+        if local is not None:
+            cached = local.get(local_key)
+            if cached is not None:
+                return orjson.loads(cached)
+
+        # Try to get from cache with error handling
+        try:
+            if self.redis:
+                if group_key is None:
+                    cached = await self.redis.get(cache_key)
+                else:
+                    cached = await self.redis.hget(group_key, cache_key)
+                if cached:
+                    if local is not None:
+                        local.set(local_key, cached, min(self.local_ttl, ttl))
+                    return orjson.loads(cached)
+        except Exception as e:
+            logger.warning(f"Redis get error for key {cache_key}: {e}")
+            # Continue to execute the function if cache fails
+
+        # Execute the original function
+        result = await func(*args, **kwargs)
+
+        # Try to set cache with error handling
+        try:
+            if self.redis or local is not None:
+                payload = self._serialize_to_json(result)
+                if local is not None:
+                    local.set(local_key, payload, min(self.local_ttl, ttl))
+                if self.redis and group_key is None:
+                    await self.redis.setex(cache_key, ttl, payload)
+                elif self.redis:
+                    await self._hset_expire_if_persistent(
+                        keys=[group_key], args=[cache_key, payload, ttl]
+                    )
+        except Exception as e:
+            logger.warning(f"Redis set error for key {cache_key}: {e}")
+            # Don't fail if caching fails, just log and continue
+
+        return result
 
     def cache_response(
         self,
         expire_seconds: Optional[int] = None,
         key: Optional[str] = None,
         model_param: Optional[str] = None,
+        group: Optional[str] = None,
     ):
         """
         Decorator cache for FastAPI.
         - expire_seconds: TTL of the cache
         - key: custom cache key
         - model_param: name of the function parameter containing model/body (e.g., 'data').
+        - group: store entries in one Redis hash per group so clear_group() drops them
+          with a single DEL. The TTL then applies to the whole hash, counted from the
+          first write after it was (re)created, not to each entry.
         """
 
         def decorator(func: Callable):
+            # A custom key without a body param never varies per request
+            static_key = self._key_prefix + key if key and not model_param else None
+            group_key = self._group_key(group) if group else None
+
             @functools.wraps(func)
             async def wrapper(*args, **kwargs):
+                # Caching disabled (no connection, no L1): skip key building entirely
+                if self.redis is None and self._local is None:
+                    return await func(*args, **kwargs)
+
+                if static_key is not None:
+                    return await self._cached_call(
+                        static_key, expire_seconds, func, args, kwargs, group_key
+                    )
+
                 request: Request = None
                 body_data = None
 
@@ -200,33 +376,9 @@ class RedisCache:
                     body_data = kwargs[model_param]
 
                 cache_key = self._build_key(request, key, body=body_data)
-
-                # Try to get from cache with error handling
-                try:
-                    if self.redis:
-                        cached = await self.redis.get(cache_key)
-                        if cached:
-                            return json.loads(cached)
-                except Exception as e:
-                    logger.warning(f"Redis get error for key {cache_key}: {e}")
-                    # Continue to execute the function if cache fails
-
-                # Execute the original function
-                result = await func(*args, **kwargs)
-
-                # Try to set cache with error handling
-                try:
-                    if self.redis:
-                        await self.redis.setex(
-                            cache_key,
-                            expire_seconds or self.default_expire,
-                            self._serialize_to_json(result),
-                        )
-                except Exception as e:
-                    logger.warning(f"Redis set error for key {cache_key}: {e}")
-                    # Don't fail if caching fails, just log and continue
-
-                return result
+                return await self._cached_call(
+                    cache_key, expire_seconds, func, args, kwargs, group_key
+                )
 
             return wrapper
 
@@ -234,14 +386,71 @@ class RedisCache:
 
     async def clear_cache(self, key: str) -> int:
         """Clear cache for a specific key."""
+        if self._local is not None:
+            self._local.delete(self._key_prefix + key)
         if self.redis:
             return await self.redis.delete(f"{self.prefix}:{key}")
         return 0
 
-    async def clear_all_cache(self, pattern: str = "*") -> int:
-        """Clear all cache matching the pattern."""
+    def _group_key(self, group: str) -> str:
+        return f"{self._key_prefix}h:{group}"
+
+    async def clear_group(self, group: str) -> int:
+        """Clear every entry cached under a cache_response group."""
+        group_key = self._group_key(group)
+        if self._local is not None:
+            self._local.delete_prefix(group_key + "|")
         if self.redis:
-            keys = await self.redis.keys(f"{self.prefix}:{pattern}")
-            if keys:
-                return await self.redis.delete(*keys)
+            return await self.redis.delete(group_key)
         return 0
+
+    async def mset_cache(
+        self, items: dict[str, Any], expire_seconds: Optional[int] = None
+    ) -> None:
+        """
+        Set several cache entries in a single round-trip.
+
+        Args:
+            items (dict[str, Any]): Mapping of key (without prefix) to value.
+            expire_seconds (Optional[int]): TTL applied to every entry.
+
+        """
+        if not items or (self.redis is None and self._local is None):
+            return
+        ttl = expire_seconds or self.default_expire
+        payloads = {
+            self._key_prefix + key: self._serialize_to_json(value)
+            for key, value in items.items()
+        }
+        # Write through so the L1 never serves the value being replaced
+        if self._local is not None:
+            local_ttl = min(self.local_ttl, ttl)
+            for cache_key, payload in payloads.items():
+                self._local.set(cache_key, payload, local_ttl)
+        if not self.redis:
+            return
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for cache_key, payload in payloads.items():
+                pipe.setex(cache_key, ttl, payload)
+            await pipe.execute()
+
+    async def clear_all_cache(self, pattern: str = "*") -> int:
+        """Clear all cache matching the pattern."""
+        if self._local is not None:
+            self._local.delete_matching(self._key_prefix + pattern)
+        if not self.redis:
+            return 0
+        deleted = 0
+        batch: list[bytes] = []
+        # SCAN walks the keyspace incrementally instead of blocking like KEYS,
+        # and UNLINK reclaims memory in a background thread on the server.
+        async for key in self.redis.scan_iter(
+            match=f"{self.prefix}:{pattern}", count=_DELETE_BATCH_SIZE
+        ):
+            batch.append(key)
+            if len(batch) >= _DELETE_BATCH_SIZE:
+                deleted += await self.redis.unlink(*batch)
+                batch.clear()
+        if batch:
+            deleted += await self.redis.unlink(*batch)
+        return deleted
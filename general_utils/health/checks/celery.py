@@ -1,3 +1,5 @@
+import asyncio
+
 from celery import Celery
 
 from ...schemas.health import HealthStatus
@@ -13,7 +15,7 @@ class CeleryHealth(HealthCheckBase):
     async def check(self):
         """Check Celery connectivity."""
         try:
-            res = self.app.control.ping(timeout=2)
+            res = await asyncio.to_thread(self.app.control.ping, timeout=2)
             if res:
                 return HealthStatus.OK, f"{len(res)} workers"
             return HealthStatus.DEGRADED, "no workers"
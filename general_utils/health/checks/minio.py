@@ -1,3 +1,6 @@
+import asyncio
+from typing import Optional
+
 from minio import Minio
 
 from ...schemas.health import HealthStatus
@@ -7,14 +10,20 @@ from ..base import HealthCheckBase
 class MinioHealth(HealthCheckBase):
     name = "minio"
 
-    def __init__(self, client: Minio):  # noqa: D107
+    def __init__(self, client: Minio, health_bucket: Optional[str] = None):  # noqa: D107
         self.client = client
+        self.health_bucket = health_bucket
 
     async def check(self):
         """Check MinIO connectivity."""
         try:
-            if self.client.list_buckets():
+            if self.health_bucket is None:
+                if await asyncio.to_thread(self.client.list_buckets):
+                    return HealthStatus.OK, "accessible"
+                return HealthStatus.DEGRADED, "empty bucket list"
+            # Single HEAD on a known bucket instead of enumerating all buckets
+            if await asyncio.to_thread(self.client.bucket_exists, self.health_bucket):
                 return HealthStatus.OK, "accessible"
-            return HealthStatus.DEGRADED, "empty bucket list"
+            return HealthStatus.DEGRADED, f"bucket '{self.health_bucket}' not found"
         except Exception as e:
             return HealthStatus.ERROR, str(e)
@@ -1,3 +1,5 @@
+import asyncio
+
 import asyncpg  # type: ignore
 
 from ...schemas.health import HealthStatus
@@ -9,13 +11,30 @@ class PostgresHealth(HealthCheckBase):
 
     def __init__(self, dsn: str):  # noqa: D107
         self.dsn = dsn
+        self._pool = None
+        self._lock = asyncio.Lock()
+
+    async def _get_pool(self):
+        if self._pool is None:
+            async with self._lock:
+                if self._pool is None:
+                    self._pool = await asyncpg.create_pool(
+                        self.dsn, min_size=1, max_size=2
+                    )
+        return self._pool
 
     async def check(self):
         """Check PostgreSQL connectivity."""
         try:
-            conn = await asyncpg.connect(self.dsn)
-            await conn.execute("SELECT 1;")
-            await conn.close()
+            pool = await self._get_pool()
+            async with pool.acquire() as conn:
+                await conn.fetchval("SELECT 1;")
             return HealthStatus.OK, "connected"
         except Exception as e:
             return HealthStatus.ERROR, str(e)
+
+    async def close(self):
+        """Close the connection pool kept between checks."""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            await pool.close()
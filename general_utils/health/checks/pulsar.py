@@ -1,3 +1,6 @@
+import asyncio
+from typing import Optional
+
 import pulsar
 
 from ...schemas.health import HealthStatus
@@ -7,14 +10,36 @@ from ..base import HealthCheckBase
 class PulsarHealth(HealthCheckBase):
     name = "pulsar"
 
-    def __init__(self, url: str):  # noqa: D107
+    def __init__(self, url: str, probe_topic: Optional[str] = None):  # noqa: D107
         self.url = url
+        self.probe_topic = probe_topic
+        self._client = None
+        self._lock = asyncio.Lock()
+
+    async def _get_client(self):
+        if self._client is None:
+            async with self._lock:
+                if self._client is None:
+                    # pulsar.Client blocks in C while connecting; keep it off the event loop
+                    self._client = await asyncio.to_thread(pulsar.Client, self.url)
+        return self._client
 
     async def check(self):
         """Check Pulsar connectivity."""
         try:
-            client = pulsar.Client(self.url)
-            client.close()
+            if self.probe_topic is None:
+                client = await asyncio.to_thread(pulsar.Client, self.url)
+                await asyncio.to_thread(client.close)
+                return HealthStatus.OK, "connected"
+            # Reused client plus a metadata lookup on a topic known to exist
+            client = await self._get_client()
+            await asyncio.to_thread(client.get_topic_partitions, self.probe_topic)
             return HealthStatus.OK, "connected"
         except Exception as e:
             return HealthStatus.ERROR, str(e)
+
+    async def close(self):
+        """Close the client kept for topic probes."""
+        client, self._client = self._client, None
+        if client is not None:
+            await asyncio.to_thread(client.close)
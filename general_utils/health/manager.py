@@ -63,6 +63,8 @@ class HealthManager:
         cache_ttl: int = 15,
         interval: int = 30,
         logger: Optional[loguru._logger.Logger] = None,
+        check_timeout: float = 3.0,
+        max_concurrency: Optional[int] = None,
     ):
         """
         Initialize HealthManager.
@@ -72,6 +74,8 @@ class HealthManager:
             cache_ttl (int): Time-to-live for cached results in seconds.
             interval (int): Interval between background checks in seconds.
             logger (Optional[loguru._logger.Logger]): Logger instance for structured logging.
+            check_timeout (float): Max seconds a single check may take before it is reported as an error.
+            max_concurrency (Optional[int]): Max checks running at once. None runs all concurrently.
 
         """
         self.checks = checks
@@ -80,11 +84,25 @@ class HealthManager:
         self._cache: CachedHealthCheckResult = None
         self._running = False
         self.logger = logger or build_logger("healthcheck")
+        self.check_timeout = check_timeout
+        self._semaphore = (
+            asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        )
+
+    async def _run_check(self, check: HealthCheckBase) -> tuple[HealthStatus, Any]:
+        """Run a single check bounded by the timeout and concurrency limit."""
+        try:
+            if self._semaphore is None:
+                return await asyncio.wait_for(check.check(), self.check_timeout)
+            async with self._semaphore:
+                return await asyncio.wait_for(check.check(), self.check_timeout)
+        except TimeoutError:
+            return HealthStatus.ERROR, f"timed out after {self.check_timeout}s"
 
     async def run_checks(self) -> Dict[str, Any]:
         """Run all checks once and update cache."""
         results: dict[str, HealthCheckComponent] = {}
-        tasks = [check.check() for check in self.checks]
+        tasks = [self._run_check(check) for check in self.checks]
         responses = await asyncio.gather(*tasks, return_exceptions=True)
 
         for checker, result in zip(self.checks, responses):
@@ -1,4 +1,5 @@
 from enum import Enum
+from operator import attrgetter
 from typing import Union
 
 
@@ -59,23 +60,8 @@ class LogLevel(Enum):
         if isinstance(value, cls):
             return value
 
-        if isinstance(value, int):
-            try:
-                return cls(value)
-            except ValueError:
-                valid_values = [level.value for level in cls]
-                raise ValueError(
-                    f"Invalid log level value: {value}. Valid values: {valid_values}"
-                )
-
-        if isinstance(value, str):
-            try:
-                return cls[value.upper()]
-            except KeyError:
-                valid_names = [level.name for level in cls]
-                raise ValueError(
-                    f"Invalid log level name: {value}. Valid names: {valid_names}"
-                )
+        if isinstance(value, int | str):
+            return _resolve_log_level(value)
 
         raise ValueError(
             f"Invalid log level type: {type(value)}. Expected str, int, or LogLevel."
@@ -87,7 +73,7 @@ class LogLevel(Enum):
         json_schema = handler(core_schema)
         json_schema.update(
             type="string",
-            enum=[level.name for level in cls],
+            enum=list(_VALID_NAMES),
             description="Log level - can be specified as string name (case insensitive) or integer value",
         )
         return json_schema
@@ -98,7 +84,12 @@ class LogLevel(Enum):
         from pydantic_core import core_schema
 
         return core_schema.no_info_plain_validator_function(
-            cls.validate, serialization=core_schema.to_string_ser_schema()
+            cls.validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                attrgetter("name"),
+                return_schema=core_schema.str_schema(),
+                when_used="json-unless-none",
+            ),
         )
 
     @classmethod
@@ -113,3 +104,34 @@ class LogLevel(Enum):
     def __repr__(self) -> str:
         """Return a detailed representation."""
         return f"<LogLevel.{self.name}: {self.value}>"
+
+
+_VALID_NAMES = tuple(level.name for level in LogLevel)
+_VALID_VALUES = tuple(level.value for level in LogLevel)
+
+# Common spellings of each level name, so most lookups avoid str.upper()
+_NAME_LOOKUP: dict[str, LogLevel] = {
+    name: level
+    for level in LogLevel
+    for name in (level.name, level.name.lower(), level.name.title())
+}
+
+
+def _resolve_log_level(value: Union[str, int]) -> LogLevel:
+    """Resolve a level name or value through the precomputed lookup tables."""
+    if isinstance(value, int):
+        member = LogLevel._value2member_map_.get(value)
+        if member is None:
+            raise ValueError(
+                f"Invalid log level value: {value}. Valid values: {list(_VALID_VALUES)}"
+            )
+        return member
+
+    member = _NAME_LOOKUP.get(value)
+    if member is None:
+        member = _NAME_LOOKUP.get(value.upper())
+    if member is None:
+        raise ValueError(
+            f"Invalid log level name: {value}. Valid names: {list(_VALID_NAMES)}"
+        )
+    return member
@@ -2,4 +2,13 @@
 
 from .otel import OTLPExporterSingleton, SpanProcessor
 
-__all__ = ["OTLPExporterSingleton", "SpanProcessor"]
+__all__ = ["OTLPExporterSingleton", "SpanProcessor", "langfuse_trace"]
+
+
+def __getattr__(name: str):
+    # langfuse is optional and heavy to import, so load it on first access only
+    if name == "langfuse_trace":
+        from .langfuse_tracer import langfuse_trace
+
+        return langfuse_trace
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -35,6 +35,42 @@ def langfuse_trace(
         span_name = name or func.__name__
         lf_client = get_client()
 
+        # Tracing disabled (tracing_enabled=False / LANGFUSE_TRACING_ENABLED=false):
+        # leave the function untouched so calls carry no span overhead.
+        if not getattr(lf_client, "_tracing_enabled", True):
+            return func
+
+        start_span = lf_client.start_as_current_span
+
+        # Everything but the auto-built input is fixed per decoration; unset
+        # (None) options are dropped so Langfuse falls back to its defaults.
+        span_kwargs = {
+            k: v
+            for k, v in dict(
+                name=span_name,
+                trace_context=trace_context,
+                output=output,
+                metadata=metadata,
+                version=version,
+                level=level,
+                status_message=status_message,
+                end_on_exit=end_on_exit,
+            ).items()
+            if v is not None
+        }
+        attributes_cm = functools.partial(
+            propagate_attributes,
+            user_id=user_id,
+            session_id=session_id,
+            metadata=pa_metadata,
+            version=pa_version,
+            tags=tags,
+            as_baggage=as_baggage,
+        )
+
+        # An explicit output wins; only record the return value otherwise
+        update_output = output is None
+
         # Build function input if user didn't specify
         def build_input(args, kwargs):
             return (
@@ -46,72 +82,48 @@ def langfuse_trace(
                 }
             )
 
-        @functools.wraps(func)
-        def sync_wrapper(*args, **kwargs):
-            func_input = build_input(args, kwargs)
+        # Only build the wrapper matching the function type
+        if asyncio.iscoroutinefunction(func):
 
-            with lf_client.start_as_current_span(
-                name=span_name,
-                trace_context=trace_context,
-                input=func_input,
-                output=output,
-                metadata=metadata,
-                version=version,
-                level=level,
-                status_message=status_message,
-                end_on_exit=end_on_exit,
-            ) as span:
-                with propagate_attributes(
-                    user_id=user_id,
-                    session_id=session_id,
-                    metadata=pa_metadata,
-                    version=pa_version,
-                    tags=tags,
-                    as_baggage=as_baggage,
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                func_input = build_input(args, kwargs)
+
+                with (
+                    start_span(input=func_input, **span_kwargs) as span,
+                    attributes_cm(),
                 ):
-                    result = func(*args, **kwargs)
+                    result = await func(*args, **kwargs)
 
-                    # Set output if not explicitly provided
-                    try:
-                        span.update_trace(output=result)
-                    except Exception:
-                        pass
+                    if update_output:
+                        try:
+                            span.update_trace(output=result)
+                        except Exception:
+                            pass
 
                     return result
 
+            return async_wrapper
+
         @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs):
+        def sync_wrapper(*args, **kwargs):
             func_input = build_input(args, kwargs)
 
-            with lf_client.start_as_current_span(
-                name=span_name,
-                trace_context=trace_context,
-                input=func_input,
-                output=output,
-                metadata=metadata,
-                version=version,
-                level=level,
-                status_message=status_message,
-                end_on_exit=end_on_exit,
-            ) as span:
-                with propagate_attributes(
-                    user_id=user_id,
-                    session_id=session_id,
-                    metadata=pa_metadata,
-                    version=pa_version,
-                    tags=tags,
-                    as_baggage=as_baggage,
-                ):
-                    result = await func(*args, **kwargs)
+            with (
+                start_span(input=func_input, **span_kwargs) as span,
+                attributes_cm(),
+            ):
+                result = func(*args, **kwargs)
 
+                # Set output if not explicitly provided
+                if update_output:
                     try:
                         span.update_trace(output=result)
                     except Exception:
                         pass
 
-                    return result
+                return result
 
-        # Choose between sync / async wrapper based on function type
-        return async_wrapper if asyncio.iscoroutinefunction(func) else sync_wrapper
+        return sync_wrapper
 
     return decorator
@@ -1,21 +1,51 @@
 import asyncio
+import itertools
 import json
+import threading
 from functools import wraps
 from typing import Any, Callable, Optional
 
 try:
+    from opentelemetry.context import attach, detach
+    from opentelemetry.exporter.otlp.proto.grpc.exporter import Compression
     from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
     from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+    from opentelemetry.sdk.trace import SpanProcessor as _SDKSpanProcessor
     from opentelemetry.sdk.trace import TracerProvider
     from opentelemetry.sdk.trace.export import BatchSpanProcessor
-    from opentelemetry.trace import get_tracer_provider, set_tracer_provider
+    from opentelemetry.trace import (
+        NoOpTracer,
+        Status,
+        StatusCode,
+        get_tracer_provider,
+        set_span_in_context,
+        set_tracer_provider,
+    )
 
     OTEL_AVAILABLE = True
+    _COMPRESSIONS = {
+        "none": Compression.NoCompression,
+        "gzip": Compression.Gzip,
+        "deflate": Compression.Deflate,
+    }
 except ImportError:
     OTEL_AVAILABLE = False
+    _SDKSpanProcessor = object
 
 from ..utils.serialization import _serialize_to_json
 
+# Keep each exporter's HTTP/2 connection alive between exports so idle
+# periods behind NATs/load balancers don't force a reconnect + TLS handshake.
+# 5 minutes matches the minimum ping interval gRPC servers (incl. the OTel
+# collector) enforce by default; pinging faster gets the connection GOAWAY'd.
+_GRPC_CHANNEL_OPTIONS = (
+    ("grpc.keepalive_time_ms", 300_000),
+    ("grpc.keepalive_timeout_ms", 20_000),
+)
+
+# Values OTel accepts as attributes directly, without a JSON round trip
+_NATIVE_ATTRIBUTE_TYPES = frozenset({str, bool, int, float})
+
 
 def set_serialize_fallback(fallback_func: Callable[[Any], dict]) -> None:
     """
@@ -29,13 +59,18 @@ def set_serialize_fallback(fallback_func: Callable[[Any], dict]) -> None:
 
 
 class OTLPExporterSingleton:
-    """Singleton class for OTLP span exporter."""
+    """Singleton class for OTLP span exporter, one per exporter configuration."""
 
-    _instance: Optional["OTLPSpanExporter"] = None
+    # (endpoint, insecure, compression) -> exporters created for that config
+    _instances: dict[tuple, list["OTLPSpanExporter"]] = {}
+    _lock = threading.Lock()
 
     @classmethod
     def get_instance(
-        cls, endpoint: str = "grpc://otel-collector:4137", insecure: bool = False
+        cls,
+        endpoint: str = "grpc://otel-collector:4137",
+        insecure: bool = False,
+        compression: Optional[str] = "gzip",
     ) -> "OTLPSpanExporter":
         """
         Get singleton instance of OTLP span exporter.
@@ -43,6 +78,8 @@ class OTLPExporterSingleton:
         Args:
             endpoint: OTLP endpoint URL
             insecure: Whether to use insecure connection
+            compression: gRPC compression ("gzip", "deflate" or "none");
+                None defers to OTEL_EXPORTER_OTLP_COMPRESSION
 
         Returns:
             OTLPSpanExporter: The singleton instance
@@ -52,16 +89,94 @@ class OTLPExporterSingleton:
             ValueError: If endpoint format is invalid
 
         """
+        return cls.get_pool(
+            1, endpoint=endpoint, insecure=insecure, compression=compression
+        )[0]
+
+    @classmethod
+    def get_pool(
+        cls,
+        pool_size: int = 1,
+        endpoint: str = "grpc://otel-collector:4137",
+        insecure: bool = False,
+        compression: Optional[str] = "gzip",
+    ) -> list["OTLPSpanExporter"]:
+        """
+        Get a pool of OTLP span exporters, each owning its own gRPC channel.
+
+        The first exporter is the one returned by ``get_instance``; the pool
+        only grows, so repeated calls with the same endpoint, ``insecure``
+        and compression share the same exporters. Safe to call from
+        multiple threads.
+
+        Args:
+            pool_size: Number of exporters to return
+            endpoint: OTLP endpoint URL
+            insecure: Whether to use insecure connection
+            compression: gRPC compression ("gzip", "deflate" or "none");
+                None defers to OTEL_EXPORTER_OTLP_COMPRESSION
+
+        Returns:
+            list[OTLPSpanExporter]: The pooled exporters
+
+        Raises:
+            ImportError: If OpenTelemetry is not available
+            ValueError: If endpoint format, compression or pool size is invalid
+
+        """
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        key = (endpoint, insecure, compression)
+        pool = cls._instances.get(key)
+        if pool is not None and len(pool) >= pool_size:
+            return pool[:pool_size]
+
         if not OTEL_AVAILABLE:
             raise ImportError(
                 "OpenTelemetry is not available. Install with: pip install general-utils[trace]"
             )
+        if not endpoint.startswith("grpc://"):
+            raise ValueError("OTLP endpoint must start with 'grpc://'")
+        if compression is not None and compression not in _COMPRESSIONS:
+            raise ValueError(
+                f"Unsupported OTLP compression {compression!r}; "
+                f"expected one of {sorted(_COMPRESSIONS)}"
+            )
+        grpc_compression = _COMPRESSIONS.get(compression)
+
+        # Re-check under the lock so racing callers don't open extra channels
+        with cls._lock:
+            pool = cls._instances.setdefault(key, [])
+            pool.extend(
+                OTLPSpanExporter(
+                    endpoint=endpoint,
+                    insecure=insecure,
+                    compression=grpc_compression,
+                    channel_options=_GRPC_CHANNEL_OPTIONS,
+                )
+                for _ in range(pool_size - len(pool))
+            )
+            return pool[:pool_size]
+
+
+class _RoundRobinSpanProcessor(_SDKSpanProcessor):
+    """Hand each finished span to one of several processors in turn."""
+
+    def __init__(self, processors: list):
+        self._processors = tuple(processors)
+        self._next = itertools.cycle(self._processors).__next__
+
+    def on_end(self, span) -> None:
+        self._next().on_end(span)
 
-        if cls._instance is None:
-            if "grpc://" not in endpoint:
-                raise ValueError("OTLP endpoint must start with 'grpc://'")
-            cls._instance = OTLPSpanExporter(endpoint=endpoint, insecure=insecure)
-        return cls._instance
+    def shutdown(self) -> None:
+        for processor in self._processors:
+            processor.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return all(
+            [processor.force_flush(timeout_millis) for processor in self._processors]
+        )
 
 
 class SpanProcessor:
@@ -72,16 +187,39 @@ class SpanProcessor:
         service_name: Name of the service
         oltp_endpoint: OTLP endpoint URL
         oltp_insecure: Whether to use insecure connection
+        oltp_compression: gRPC compression for span exports
         serialize_fallback: Optional callable for custom serialization fallback
+        max_queue_size: Maximum number of spans buffered before export
+        max_export_batch_size: Maximum number of spans sent per export
+        schedule_delay_millis: Delay between two consecutive exports
+        export_timeout_millis: Time limit for a single export
+        exporter_pool_size: Number of exporters exporting in parallel
+        max_attr_length: Maximum length of serialized input/output attributes
 
     """
 
+    __slots__ = (
+        "service_name",
+        "oltp_endpoint",
+        "oltp_insecure",
+        "oltp_compression",
+        "max_attr_length",
+        "_tracer",
+    )
+
     def __init__(
         self,
         service_name: str,
         oltp_endpoint: str = "grpc://otel-collector:4137",
         oltp_insecure: bool = False,
+        oltp_compression: Optional[str] = "gzip",
         serialize_fallback: Optional[Callable[[Any], dict]] = None,
+        max_queue_size: int = 8192,
+        max_export_batch_size: int = 128,
+        schedule_delay_millis: float = 1000,
+        export_timeout_millis: float = 10000,
+        exporter_pool_size: int = 1,
+        max_attr_length: Optional[int] = 8192,
     ):
         """
         Initialize span processor with OpenTelemetry configuration.
@@ -90,7 +228,21 @@ class SpanProcessor:
             service_name: Name of the service
             oltp_endpoint: OTLP endpoint URL
             oltp_insecure: Whether to use insecure connection
+            oltp_compression: gRPC compression ("gzip", "deflate" or "none");
+                None defers to OTEL_EXPORTER_OTLP_COMPRESSION
             serialize_fallback: Optional callable for custom serialization fallback
+            max_queue_size: Maximum number of spans buffered before export
+            max_export_batch_size: Maximum number of spans sent per export. With
+                input/output attributes capped at ``max_attr_length`` this keeps
+                an export request under gRPC's default 4 MiB message limit.
+            schedule_delay_millis: Delay between two consecutive exports
+            export_timeout_millis: Time limit for a single export
+            exporter_pool_size: Number of exporters exporting in parallel. Each
+                gets its own batch processor (queue sizes apply per processor)
+                and finished spans are spread across them round-robin.
+            max_attr_length: Serialized input/output/tag attributes longer than
+                this are truncated with a "...[truncated N chars]" marker.
+                None disables truncation.
 
         Raises:
             ImportError: If OpenTelemetry is not available
@@ -118,6 +270,8 @@ class SpanProcessor:
         self.service_name = service_name
         self.oltp_endpoint = oltp_endpoint
         self.oltp_insecure = oltp_insecure
+        self.oltp_compression = oltp_compression
+        self.max_attr_length = max_attr_length
 
         # Support custom serialization fallback from parameter
         if serialize_fallback:
@@ -127,14 +281,33 @@ class SpanProcessor:
         resource = Resource.create({SERVICE_NAME: self.service_name})
         set_tracer_provider(TracerProvider(resource=resource))
 
-        # Get singleton exporter
-        exporter = OTLPExporterSingleton.get_instance(
-            endpoint=self.oltp_endpoint, insecure=self.oltp_insecure
+        # Get singleton exporter(s)
+        exporters = OTLPExporterSingleton.get_pool(
+            exporter_pool_size,
+            endpoint=self.oltp_endpoint,
+            insecure=self.oltp_insecure,
+            compression=self.oltp_compression,
         )
 
-        # Add batch span processor
-        span_processor = BatchSpanProcessor(exporter)
-        get_tracer_provider().add_span_processor(span_processor)
+        # Add batch span processor(s); larger batches mean fewer gRPC exports
+        batch_processors = [
+            BatchSpanProcessor(
+                exporter,
+                max_queue_size=max_queue_size,
+                max_export_batch_size=max_export_batch_size,
+                schedule_delay_millis=schedule_delay_millis,
+                export_timeout_millis=export_timeout_millis,
+            )
+            for exporter in exporters
+        ]
+        if len(batch_processors) == 1:
+            span_processor = batch_processors[0]
+        else:
+            # Registering each one directly would export every span N times
+            span_processor = _RoundRobinSpanProcessor(batch_processors)
+        tracer_provider = get_tracer_provider()
+        tracer_provider.add_span_processor(span_processor)
+        self._tracer = tracer_provider.get_tracer(self.service_name)
 
     def log_trace(
         self,
@@ -152,10 +325,20 @@ class SpanProcessor:
             prefix (str): Attribute prefix for input/output logging.
             log_input (bool): Whether to log function input arguments. Default True.
             log_output (bool): Whether to log function output/return value. Default True.
+            tag_names (str | list[str]): Keyword arguments to record as ``tag.<name>``
+                attributes. str/int/float/bool values are set as-is, anything
+                else is JSON encoded.
 
         Returns:
             Callable: The decorated function with tracing capabilities.
 
+        Note:
+            The span is the current span in the caller's contextvars context
+            while the function runs, so spans started in ``asyncio.create_task``
+            or ``asyncio.to_thread`` calls made from it get it as parent. Work
+            sent through ``loop.run_in_executor`` or a raw thread does not copy
+            the context; wrap it with ``contextvars.copy_context().run``.
+
         Raises:
             ImportError: If OpenTelemetry is not available
 
@@ -165,78 +348,151 @@ class SpanProcessor:
                 "OpenTelemetry is not available. Install with: pip install general-utils[trace]"
             )
 
+        # Tracing disabled (e.g. OTEL_SDK_DISABLED=true): every span would be
+        # discarded, so return the function itself without a wrapper frame
+        if isinstance(self._tracer, NoOpTracer):
+            return lambda func: func
+
         if type(tag_names) is str:
             tag_names = [tag_names]
 
+        # Attribute keys are fixed per decorator; build them once, not per call
+        input_key = f"{prefix}.input"
+        output_key = f"{prefix}.output"
+        tag_keys = [(tag, f"tag.{tag}") for tag in tag_names]
+        start_span = self._tracer.start_span
+        limit = self.max_attr_length
+        if limit is None:
+            serialize = _serialize_to_json
+        else:
+
+            def serialize(data: Any) -> str:
+                # Bound what large args/results cost the exporter and backend
+                text = _serialize_to_json(data)
+                if len(text) > limit:
+                    return f"{text[:limit]}...[truncated {len(text) - limit} chars]"
+                return text
+
+        # Zero-argument calls always log the same input payload
+        empty_input = serialize({"args": (), "kwargs": {}}) if log_input else None
 
         def decorator(func):
-            tracer = get_tracer_provider().get_tracer(self.service_name)
 
             if asyncio.iscoroutinefunction(func):
 
                 @wraps(func)
                 async def wrapper(*args, **kwargs):
-                    with tracer.start_as_current_span(span_name) as span:
-                        if log_input:
-                            input_data = {"args": args, "kwargs": kwargs}
-                            span.set_attribute(
-                                f"{prefix}.input", _serialize_to_json(input_data)
-                            )
+                    # Activate the span directly rather than through the two
+                    # generator context managers behind start_as_current_span
+                    span = start_span(span_name)
+                    # Sampled-out spans drop attributes; skip serializing them
+                    recording = span.is_recording()
+                    # Collected and set in one call, i.e. one span lock round
+                    attributes = {} if recording else None
+                    token = attach(set_span_in_context(span))
+                    try:
+                        if not recording:
+                            return await func(*args, **kwargs)
 
-                        for tag in tag_names:
-                            if tag in kwargs:
-                                span.set_attribute(f"tag.{tag}", _serialize_to_json(kwargs[tag]))
+                        if log_input:
+                            if args or kwargs:
+                                input_data = {"args": args, "kwargs": kwargs}
+                                attributes[input_key] = serialize(input_data)
+                            else:
+                                attributes[input_key] = empty_input
+
+                        if kwargs:
+                            for tag, tag_key in tag_keys:
+                                if tag in kwargs:
+                                    value = kwargs[tag]
+                                    if type(value) not in _NATIVE_ATTRIBUTE_TYPES:
+                                        value = serialize(value)
+                                    attributes[tag_key] = value
 
                         try:
                             result = await func(*args, **kwargs)
                             if log_output:
-                                span.set_attribute(
-                                    f"{prefix}.output", _serialize_to_json(result)
-                                )
+                                attributes[output_key] = serialize(result)
                             return result
                         except Exception as e:
-                            error_data = {
-                                "error": str(e),
-                                "error_type": type(e).__name__,
-                            }
                             if log_output:
-                                span.set_attribute(
-                                    f"{prefix}.output", _serialize_to_json(error_data)
-                                )
+                                error_data = {
+                                    "error": str(e),
+                                    "error_type": type(e).__name__,
+                                }
+                                attributes[output_key] = serialize(error_data)
                             raise
+                    except Exception as e:
+                        # What use_span() records for a failing span
+                        if recording:
+                            span.record_exception(e)
+                            span.set_status(
+                                Status(StatusCode.ERROR, f"{type(e).__name__}: {e}")
+                            )
+                        raise
+                    finally:
+                        if attributes:
+                            span.set_attributes(attributes)
+                        detach(token)
+                        span.end()
 
             else:
 
                 @wraps(func)
                 def wrapper(*args, **kwargs):
-                    with tracer.start_as_current_span(span_name) as span:
-                        if log_input:
-                            input_data = {"args": args, "kwargs": kwargs}
-                            span.set_attribute(
-                                f"{prefix}.input", _serialize_to_json(input_data)
-                            )
+                    # Activate the span directly rather than through the two
+                    # generator context managers behind start_as_current_span
+                    span = start_span(span_name)
+                    # Sampled-out spans drop attributes; skip serializing them
+                    recording = span.is_recording()
+                    # Collected and set in one call, i.e. one span lock round
+                    attributes = {} if recording else None
+                    token = attach(set_span_in_context(span))
+                    try:
+                        if not recording:
+                            return func(*args, **kwargs)
 
-                        for tag in tag_names:
-                            if tag in kwargs:
-                                span.set_attribute(f"tag.{tag}", _serialize_to_json(kwargs[tag]))
+                        if log_input:
+                            if args or kwargs:
+                                input_data = {"args": args, "kwargs": kwargs}
+                                attributes[input_key] = serialize(input_data)
+                            else:
+                                attributes[input_key] = empty_input
+
+                        if kwargs:
+                            for tag, tag_key in tag_keys:
+                                if tag in kwargs:
+                                    value = kwargs[tag]
+                                    if type(value) not in _NATIVE_ATTRIBUTE_TYPES:
+                                        value = serialize(value)
+                                    attributes[tag_key] = value
 
                         try:
                             result = func(*args, **kwargs)
                             if log_output:
-                                span.set_attribute(
-                                    f"{prefix}.output", _serialize_to_json(result)
-                                )
+                                attributes[output_key] = serialize(result)
                             return result
                         except Exception as e:
-                            error_data = {
-                                "error": str(e),
-                                "error_type": type(e).__name__,
-                            }
                             if log_output:
-                                span.set_attribute(
-                                    f"{prefix}.output", _serialize_to_json(error_data)
-                                )
+                                error_data = {
+                                    "error": str(e),
+                                    "error_type": type(e).__name__,
+                                }
+                                attributes[output_key] = serialize(error_data)
                             raise
+                    except Exception as e:
+                        # What use_span() records for a failing span
+                        if recording:
+                            span.record_exception(e)
+                            span.set_status(
+                                Status(StatusCode.ERROR, f"{type(e).__name__}: {e}")
+                            )
+                        raise
+                    finally:
+                        if attributes:
+                            span.set_attributes(attributes)
+                        detach(token)
+                        span.end()
 
             return wrapper
 
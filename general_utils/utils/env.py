@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 
 
 def get_env(name: str):
@@ -22,3 +23,25 @@ def get_env(name: str):
         raise ValueError(f"Environment variable '{name}' is set to an empty string.")
 
     return value
+
+
+@lru_cache(maxsize=128)
+def get_env_cached(name: str) -> str:
+    """
+    Get the value of an environment variable, memoized per name.
+
+    Same checks as ``get_env``, but each name is read from the environment
+    once; later calls are a cache lookup. Failed lookups are not cached.
+    Call ``clear_env_cache`` after changing ``os.environ`` at runtime.
+    :param name: The name of the environment variable.
+    :return: The value of the environment variable.
+    :raises KeyError: If the environment variable is not set.
+    :raises ValueError: If the environment variable is set to an empty string.
+    :raises TypeError: If the name is not a string.
+    """
+    return get_env(name)
+
+
+def clear_env_cache() -> None:
+    """Forget values memoized by ``get_env_cached``."""
+    get_env_cached.cache_clear()
@@ -3,14 +3,13 @@ import logging  # noqa: TID251
 import os
 import shutil
 import sys
-import threading
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Callable, Dict, Optional, Union
 
 import loguru
 import loguru._logger
-from memoization import CachingAlgorithmFlag, cached
 
 from ..schemas.logging import LogLevel
 
@@ -40,6 +39,24 @@ class LogRotationConfig:
         self.compression = compression
         self.rotation_time = rotation_time
 
+    def _key(self) -> tuple:
+        return (
+            self.max_file_size,
+            self.backup_count,
+            self.compression,
+            self.rotation_time,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Compare by settings, so equal configs share a cached build_logger."""
+        if not isinstance(other, LogRotationConfig):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        """Hash by settings, matching __eq__."""
+        return hash(self._key())
+
 
 class LogManager:
     """
@@ -49,16 +66,12 @@ class LogManager:
     with consistent configuration, rotation, and filtering.
     """
 
-    _instance = None
-    _lock = threading.Lock()
+    # Created right after the class body, at import time, so no lock is needed
+    _instance: Optional["LogManager"] = None
     _loggers: Dict[str, loguru._logger.Logger] = {}
 
     def __new__(cls):
-        """Ensure singleton pattern with thread safety."""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
+        """Return the shared instance."""
         return cls._instance
 
     def __init__(self):
@@ -109,9 +122,11 @@ class LogManager:
         """
         try:
             if compression == "gz":
+                # Level 1 is several times faster than the default 9 and text
+                # logs compress nearly as well; copy in 1 MiB chunks
                 with open(file_path, "rb") as f_in:
-                    with gzip.open(f"{file_path}.gz", "wb") as f_out:
-                        shutil.copyfileobj(f_in, f_out)
+                    with gzip.open(f"{file_path}.gz", "wb", compresslevel=1) as f_out:
+                        shutil.copyfileobj(f_in, f_out, length=1024 * 1024)
                 file_path.unlink()
             elif compression == "zip":
                 import zipfile
@@ -124,52 +139,18 @@ class LogManager:
         except Exception as e:
             print(f"Warning: Failed to compress {file_path}: {e}")
 
-    def _log_filter(
-        self,
-        record: dict,
-        log_verbose: bool = True,
-        min_level: Union[LogLevel, str] = LogLevel.INFO,
-    ) -> bool:
-        """
-        Enhanced log filtering with better error handling.
-
-        Args:
-            record: Log record dictionary
-            log_verbose: Whether to show debug logs and full error traces
-            min_level: Minimum log level to show
-
-        Returns:
-            bool: True if the record should be logged, False otherwise
-
-        """
-        try:
-            # Convert min_level to LogLevel enum if it's a string
-            if isinstance(min_level, str):
-                min_level = LogLevel[min_level.upper()]
-
-            # Filter by minimum log level
-            if record["level"].no < min_level.value:
-                return False
-
-            # Hide debug and trace logs if verbose mode is disabled (additional filter)
-            if record["level"].no <= LogLevel.DEBUG.value and not log_verbose:
-                return False
-
-            # Handle exception display based on verbose mode
-            if record["level"].no == LogLevel.ERROR.value and not log_verbose:
-                record["exception"] = None
-
-            return True
-        except (KeyError, AttributeError) as e:
-            # If record is malformed, log it anyway to avoid losing information
-            print(f"Warning: Malformed log record: {e}")
-            return True
 
+LogManager._instance = object.__new__(LogManager)
 
 # Global variables for filter state
 _log_verbose_global = True
-_log_level_global = LogLevel.INFO
-_log_manager_instance = None
+# Plain ints so _filter_logs compares record levels without enum access
+_DEBUG_NO = LogLevel.DEBUG.value
+_ERROR_NO = LogLevel.ERROR.value
+
+# Handlers installed by build_logger: role -> (config, loguru handler id)
+_installed_handlers: Dict[str, tuple] = {}
+_handlers_reset = False
 
 
 def _get_effective_log_level(
@@ -202,7 +183,7 @@ def _get_effective_log_level(
         try:
             # Try to convert environment variable to LogLevel enum
             if isinstance(env_log_level, str):
-                return LogLevel[env_log_level.upper()]
+                return LogLevel.from_string(env_log_level)
             return env_log_level
         except (KeyError, ValueError):
             # If invalid level in environment variable, fall back to parameter
@@ -216,7 +197,12 @@ def _get_effective_log_level(
 
 def _filter_logs(record: dict) -> bool:
     """
-    Legacy filter function for backward compatibility.
+    Apply the non-verbose rules set by the last build_logger call.
+
+    The minimum level is enforced by the handlers' own ``level=``; this only
+    hides debug/trace logs and strips error tracebacks. build_logger installs
+    it only when ``log_verbose`` is False, so verbose handlers run no Python
+    filter per record at all.
 
     Args:
         record: Log record dictionary
@@ -225,15 +211,16 @@ def _filter_logs(record: dict) -> bool:
         bool: True if the record should be logged, False otherwise
 
     """
-    global _log_manager_instance, _log_verbose_global, _log_level_global
-    if _log_manager_instance is None:
-        _log_manager_instance = LogManager()
-    return _log_manager_instance._log_filter(
-        record, _log_verbose_global, _log_level_global
-    )
+    if not _log_verbose_global:
+        level_no = record["level"].no
+        if level_no <= _DEBUG_NO:
+            return False
+        if level_no == _ERROR_NO:
+            record["exception"] = None
+    return True
 
 
-@cached(max_size=100, algorithm=CachingAlgorithmFlag.LRU)
+@lru_cache(maxsize=100)
 def build_logger(
     log_file: str = "App-Logger",
     rotation_config: Optional[LogRotationConfig] = None,
@@ -270,7 +257,7 @@ def build_logger(
         loguru.Logger: Configured logger instance
 
     Raises:
-        ValueError: If log_file parameter is invalid
+        ValueError: If log_file or level parameter is invalid
         OSError: If log directory cannot be created or accessed
 
     Example:
@@ -320,14 +307,9 @@ def build_logger(
     elif isinstance(log_path, str):
         log_path = Path(log_path)
 
-    # Update global verbose setting and log level for filter
-    global _log_verbose_global, _log_level_global
+    # Update global verbose setting for filter
+    global _log_verbose_global
     _log_verbose_global = log_verbose
-    _log_level_global = (
-        effective_level
-        if isinstance(effective_level, LogLevel)
-        else LogLevel[effective_level.upper()]
-    )
 
     # Set up rotation configuration
     if rotation_config is None:
@@ -346,20 +328,32 @@ def build_logger(
     if isinstance(effective_level, LogLevel):
         effective_level = effective_level.name
 
-    # Ensure log manager is initialized and setup log directory
-    log_manager = LogManager()
-    validated_log_path = log_manager._setup_log_directory(log_path)
+    # Validate the log directory (once per directory)
+    validated_log_path = _validate_log_dir(log_path)
 
     logger = loguru.logger
 
-    # Remove default handler and add console handler with proper filter and level
-    logger.remove()
-    logger.add(
-        sys.stderr,
-        format=format_string,
-        level=effective_level,
-        filter=_filter_logs,
-        colorize=True,
+    # Drop loguru's default handler (and any foreign ones) on first use only
+    global _handlers_reset
+    if not _handlers_reset:
+        logger.remove()
+        _handlers_reset = True
+
+    # Level filtering happens inside loguru; the Python filter only matters
+    # when non-verbose
+    log_filter = None if log_verbose else _filter_logs
+
+    # Console handler with proper filter and level
+    _install_handler(
+        "console",
+        (format_string, effective_level, log_filter),
+        lambda: logger.add(
+            sys.stderr,
+            format=format_string,
+            level=effective_level,
+            filter=log_filter,
+            colorize=True,
+        ),
     )
 
     # Add backward compatibility aliases
@@ -374,25 +368,86 @@ def build_logger(
         rotation = rotation_config.max_file_size
         if rotation_config.rotation_time:
             rotation = rotation_config.rotation_time
+        compression = _get_compression_function(rotation_config.compression)
 
         # Add file handler with rotation and compression
-        logger.add(
-            log_file_path,
-            format=format_string,
-            level=effective_level,
-            rotation=rotation,
-            retention=rotation_config.backup_count,
-            compression=_get_compression_function(rotation_config.compression),
-            colorize=False,
-            filter=_filter_logs,
-            backtrace=True,
-            diagnose=True,
-            enqueue=True,  # Thread-safe logging
+        _install_handler(
+            "file",
+            (
+                log_file_path,
+                format_string,
+                effective_level,
+                rotation,
+                rotation_config.backup_count,
+                compression,
+                log_filter,
+            ),
+            lambda: logger.add(
+                log_file_path,
+                format=format_string,
+                level=effective_level,
+                rotation=rotation,
+                retention=rotation_config.backup_count,
+                compression=compression,
+                colorize=False,
+                filter=log_filter,
+                backtrace=True,
+                diagnose=True,
+                enqueue=True,  # Thread-safe logging
+            ),
         )
+    else:
+        _install_handler("file", None, None)
 
     return logger
 
 
+@lru_cache(maxsize=32)
+def _validate_log_dir(log_path: Path) -> Path:
+    """
+    Validate a log directory once and reuse the result.
+
+    Loggers sharing a directory skip the mkdir and write test after the first.
+
+    Args:
+        log_path: Desired log directory path
+
+    Returns:
+        Path: Validated log directory path (or fallback)
+
+    """
+    return LogManager()._setup_log_directory(log_path)
+
+
+def _install_handler(
+    role: str, config: Optional[tuple], add: Optional[Callable[[], int]]
+) -> None:
+    """
+    Install the handler for a role unless an identical one is already there.
+
+    build_logger keeps one console and one file handler. Re-adding an
+    unchanged handler on every call would tear down and restart the
+    ``enqueue=True`` file writer thread for nothing.
+
+    Args:
+        role: Handler slot ("console" or "file")
+        config: Values the handler was built from, None to remove the slot
+        add: Callable adding the handler and returning its loguru id
+
+    """
+    installed = _installed_handlers.get(role)
+    if installed is not None:
+        # The handler may have been dropped by an outside logger.remove()
+        alive = installed[1] in loguru.logger._core.handlers
+        if alive and installed[0] == config:
+            return
+        if alive:
+            loguru.logger.remove(installed[1])
+        del _installed_handlers[role]
+    if config is not None:
+        _installed_handlers[role] = (config, add())
+
+
 def _prepare_log_file_path(log_file: str, base_log_path: Path) -> Path:
     """
     Prepare and validate log file path.
@@ -536,12 +591,6 @@ def get_config_dict(
         ```
 
     """
-    # for windows, the path should be a raw string.
-    log_file_path = (
-        log_file_path.encode("unicode-escape").decode()
-        if os.name == "nt"
-        else log_file_path
-    )
     log_level = log_level.upper()
     config_dict = {
         "version": 1,
@@ -1,9 +1,110 @@
-import asyncio
 import json
-from typing import Any
+from collections.abc import Awaitable, Iterable, Iterator
+from typing import Any, Callable
 
 from pydantic import BaseModel
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+    # numpy arrays/scalars are encoded natively instead of via list() + repr
+    _ORJSON_OPTIONS = (
+        orjson.OPT_SERIALIZE_NUMPY,
+        orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    )
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _serialize_model(obj: BaseModel) -> Any:
+    # Using model_dump ensures proper conversion of datetimes, enums, etc.
+    return obj.model_dump(mode="json")
+
+
+def _serialize_bytes(obj: bytes | bytearray) -> str:
+    try:
+        return obj.decode("utf-8")
+    except Exception:  # pragma: no cover - very edge case
+        return repr(obj)
+
+
+def _serialize_exception(obj: Exception) -> dict:
+    return {"error": str(obj), "error_type": type(obj).__name__}
+
+
+def _serialize_awaitable(obj: Any) -> str:
+    return f"<coroutine {obj.__class__.__name__}>"
+
+
+def _serialize_iterable(obj: Any) -> Any:
+    # Attempt list conversion (may still fail if infinite)
+    try:
+        return list(obj)
+    except Exception:
+        return _serialize_fallback(obj)
+
+
+def _serialize_fallback(obj: Any) -> Any:
+    # User provided fallback (can raise its own TypeError which json will catch)
+    fallback_serializer = getattr(_serialize_to_json, "_fallback_serializer", None)
+    if fallback_serializer is not None:
+        try:
+            return fallback_serializer(obj)
+        except Exception:  # If user fallback fails, continue to final error
+            pass
+
+    # Final fallback – string repr so we never completely fail here.
+    return repr(obj)
+
+
+def _resolve_handler(tp: type) -> Callable[[Any], Any]:
+    """Pick the handler for a type once; the result is memoized in _HANDLERS."""
+    if issubclass(tp, BaseModel):
+        return _serialize_model
+    if issubclass(tp, set | frozenset):
+        return list
+    if issubclass(tp, bytes | bytearray):
+        return _serialize_bytes
+    if issubclass(tp, Exception):
+        return _serialize_exception
+    # Awaitable's subclass hook finds __await__ on the type's MRO
+    if issubclass(tp, Awaitable):
+        return _serialize_awaitable
+    # Re-iterable containers only: iterators/generators would be silently
+    # exhausted, taking the data away from the traced code.
+    if (
+        issubclass(tp, Iterable)
+        and not issubclass(tp, Iterator)
+        and not issubclass(tp, str | bytes | dict | list | tuple)
+    ):
+        return _serialize_iterable
+    return _serialize_fallback
+
+
+# type -> handler for objects json can't encode natively, filled lazily
+_HANDLERS: dict[type, Callable[[Any], Any]] = {
+    set: list,
+    frozenset: list,
+    bytes: _serialize_bytes,
+    bytearray: _serialize_bytes,
+}
+
+
+def _default_serializer(obj: Any) -> Any:
+    """
+    Handle objects that aren't directly JSON serializable.
+
+    NOTE: We purposefully return a *Python* object (dict/list/str/etc.)
+    that json.dumps can then serialize - we do NOT return a JSON string
+    here to avoid double-encoding (which would add extra quotes).
+    """
+    tp = type(obj)
+    handler = _HANDLERS.get(tp)
+    if handler is None:
+        handler = _HANDLERS[tp] = _resolve_handler(tp)
+    return handler(obj)
+
 
 def _serialize_to_json(data) -> str:
     """
@@ -16,62 +117,25 @@ def _serialize_to_json(data) -> str:
     Returns:
         str: JSON string representation of the data.
 
-    """
-
-    def _default_serializer(obj: Any) -> Any:
-        """
-        Handle objects that aren't directly JSON serializable.
-
-        NOTE: We purposefully return a *Python* object (dict/list/str/etc.)
-        that json.dumps can then serialize - we do NOT return a JSON string
-        here to avoid double-encoding (which would add extra quotes).
-        """
-        # Pydantic BaseModel -> dict
-        if isinstance(obj, BaseModel):
-            # Using model_dump ensures proper conversion of datetimes, enums, etc.
-            return obj.model_dump(mode="json")
-
-        # Sets / frozensets -> list
-        if isinstance(obj, set | frozenset):
-            return list(obj)
-
-        # Bytes / bytearray -> decoded utf-8 (fallback to repr)
-        if isinstance(obj, bytes | bytearray):
-            try:
-                return obj.decode("utf-8")
-            except Exception:  # pragma: no cover - very edge case
-                return repr(obj)
-
-        # Exception -> structured dict
-        if isinstance(obj, Exception):
-            return {"error": str(obj), "error_type": type(obj).__name__}
-
-        # Coroutines / generators (log their repr)
-        if asyncio.iscoroutine(obj) or hasattr(obj, "__await__"):
-            return f"<coroutine {obj.__class__.__name__}>"
-        if hasattr(obj, "__iter__") and not isinstance(
-            obj, str | bytes | dict | list | tuple
-        ):
-            # For other iterables, attempt list conversion (may still fail if infinite)
-            try:
-                return list(obj)
-            except Exception:
-                pass
+    Uses orjson when installed (``general-utils[trace]``), which walks the
+    whole tree in native code; otherwise falls back to the stdlib encoder.
+    Keys keep their insertion order; they are not sorted.
 
-        # User provided fallback (can raise its own TypeError which json will catch)
-        fallback_serializer = getattr(_serialize_to_json, "_fallback_serializer", None)
-        if fallback_serializer is not None:
+    """
+    if ORJSON_AVAILABLE:
+        # OPT_NON_STR_KEYS slows down every dict, so only retry with it when a
+        # non-str key is actually present.
+        for option in _ORJSON_OPTIONS:
             try:
-                return fallback_serializer(obj)
-            except Exception:  # If user fallback fails, continue to final error
+                return orjson.dumps(
+                    data, default=_default_serializer, option=option
+                ).decode()
+            except orjson.JSONEncodeError:
                 pass
-
-        # Final fallback – string repr so we never completely fail here.
-        return repr(obj)
+        # e.g. ints beyond 64 bits; the stdlib encoder handles those
 
     body_str = json.dumps(
         data,
-        sort_keys=True,
         ensure_ascii=False,
         default=_default_serializer,
     )
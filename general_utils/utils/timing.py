@@ -1,12 +1,268 @@
+import atexit
 import inspect
 import json
+import logging  # noqa: TID251
 import os
+import queue
+import threading
 import time
-from functools import lru_cache, wraps
-from typing import Callable, Optional
+from array import array
+from functools import lru_cache, partial, wraps
+from typing import Callable, Dict, Optional
 
+from ..schemas.logging import LogLevel
 from .log_common import build_logger
 
+try:
+    import orjson
+
+    def _dumps_record(record: dict) -> bytes:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+
+except ImportError:
+
+    def _dumps_record(record: dict) -> bytes:
+        return (
+            json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        ).encode("utf-8")
+
+
+# Monotonic, high-resolution clock for elapsed time; time.time() is kept only
+# for the wall-clock "timestamp" in structured records. Integer nanoseconds keep
+# full resolution however long the process has been up; elapsed values are
+# converted to float seconds once, after the call.
+_perf_counter_ns = time.perf_counter_ns
+
+# JSONL sinks for ``record_to``: one O_APPEND descriptor per path, with lines
+# batched in memory and written with a single os.write every
+# ``_RECORD_FLUSH_EVERY`` records, at most ``_RECORD_FLUSH_INTERVAL`` seconds
+# after a line is buffered, and at exit. Appends from several processes
+# sharing a file therefore never interleave within a batch.
+_RECORD_FLUSH_EVERY = 256
+_RECORD_FLUSH_INTERVAL = 1.0
+_RECORD_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+_record_sinks: Dict[str, list] = {}  # path -> [fd, pending bytearray, count]
+_record_lock = threading.Lock()
+_record_timer: Optional[threading.Timer] = None
+
+
+def _flush_sink(sink: list):
+    fd, pending = sink[0], sink[1]
+    written, size = 0, len(pending)
+    try:
+        with memoryview(pending) as view:
+            while written < size:
+                written += os.write(fd, view[written:])
+    finally:
+        # A batch that failed to write is dropped, not retried on every call
+        del pending[:]
+        sink[2] = 0
+
+
+def _flush_pending_records():
+    """Timer callback writing out every buffered batch."""
+    global _record_timer
+    with _record_lock:
+        _record_timer = None
+        for sink in _record_sinks.values():
+            if sink[1]:
+                try:
+                    _flush_sink(sink)
+                except OSError:
+                    pass
+
+
+def _write_record(path: str, line: bytes):
+    """Append an encoded JSONL line to ``path`` via a shared buffered sink."""
+    global _record_timer
+    with _record_lock:
+        sink = _record_sinks.get(path)
+        if sink is None:
+            fd = os.open(path, _RECORD_OPEN_FLAGS, 0o644)
+            sink = _record_sinks[path] = [fd, bytearray(), 0]
+        sink[1] += line
+        sink[2] += 1
+        if sink[2] >= _RECORD_FLUSH_EVERY:
+            _flush_sink(sink)
+        elif _record_timer is None:
+            # Low-traffic paths still reach disk within the flush interval
+            _record_timer = threading.Timer(
+                _RECORD_FLUSH_INTERVAL, _flush_pending_records
+            )
+            _record_timer.daemon = True
+            _record_timer.start()
+
+
+def _reset_records_after_fork():
+    """Drop the parent's buffered lines so a forked child never re-writes them."""
+    # Descriptors stay open and are reused: O_APPEND keeps appends safe when
+    # parent and child write the same file.
+    global _record_lock, _record_timer
+    _record_lock = threading.Lock()
+    _record_timer = None
+    for sink in _record_sinks.values():
+        sink[1] = bytearray()
+        sink[2] = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_records_after_fork)
+
+
+@atexit.register
+def _close_record_files():
+    """Flush and close every JSONL sink opened by ``_write_record``."""
+    with _record_lock:
+        for sink in _record_sinks.values():
+            try:
+                _flush_sink(sink)
+                os.close(sink[0])
+            except OSError:
+                pass
+        _record_sinks.clear()
+
+
+# metric_collector calls and stdlib log records are handed to a daemon thread
+# so slow collectors and handlers (locks, socket or file IO) do not stall the
+# timed call. Items: (func, args, logger, failure message)
+_background_queue: queue.SimpleQueue = queue.SimpleQueue()
+_background_worker: Optional[threading.Thread] = None
+_background_worker_lock = threading.Lock()
+
+
+def _run_background(item: tuple):
+    func, args, logger, failure = item
+    try:
+        func(*args)
+    except Exception as e:
+        logger.warning(f"[timing_v2] {failure}: {e}")
+
+
+def _background_worker_loop():
+    get = _background_queue.get
+    while True:
+        _run_background(get())
+
+
+def _submit_background(func: Callable, args: tuple, logger, failure: str):
+    """Queue ``func(*args)`` for the background timing thread."""
+    global _background_worker
+    if _background_worker is None:
+        with _background_worker_lock:
+            if _background_worker is None:
+                worker = threading.Thread(
+                    target=_background_worker_loop, name="timing-worker", daemon=True
+                )
+                worker.start()
+                _background_worker = worker
+    _background_queue.put_nowait((func, args, logger, failure))
+
+
+def _reset_background_after_fork():
+    """Give a forked child its own queue and let it start a fresh worker."""
+    # The parent's thread does not exist in the child, and items the parent
+    # queued are the parent's to deliver.
+    global _background_queue, _background_worker, _background_worker_lock
+    _background_queue = queue.SimpleQueue()
+    _background_worker = None
+    _background_worker_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_background_after_fork)
+
+
+@atexit.register
+def _drain_background():
+    """Run work still queued when the interpreter exits."""
+    while True:
+        try:
+            item = _background_queue.get_nowait()
+        except queue.Empty:
+            return
+        _run_background(item)
+
+
+class _MetricBatcher:
+    """
+    Collects elapsed samples for one decorated function and flushes them together.
+
+    Samples accumulate in an ``array('d')`` and are handed to the collector as
+    ``(name, samples)`` on the background thread once ``size`` samples are
+    buffered or the oldest buffered sample is ``interval`` seconds old.
+    """
+
+    __slots__ = (
+        "collector",
+        "name",
+        "logger",
+        "size",
+        "interval",
+        "samples",
+        "oldest",
+        "lock",
+    )
+
+    def __init__(self, collector, name: str, logger, size: int, interval: float):
+        self.collector = collector
+        self.name = name
+        self.logger = logger
+        self.size = size
+        self.interval = interval
+        self.samples = array("d")
+        self.oldest = 0.0
+        self.lock = threading.Lock()
+
+    def add(self, elapsed: float):
+        """Buffer one sample, queueing the batch when it is due."""
+        now = time.monotonic()
+        with self.lock:
+            if not self.samples:
+                self.oldest = now
+            self.samples.append(elapsed)
+            if len(self.samples) < self.size and now - self.oldest < self.interval:
+                return
+            samples, self.samples = self.samples, array("d")
+        _submit_background(*self._item(samples))
+
+    def take(self) -> array:
+        """Detach and return the buffered samples."""
+        with self.lock:
+            samples, self.samples = self.samples, array("d")
+        return samples
+
+    def _item(self, samples: array) -> tuple:
+        return (
+            self.collector,
+            (self.name, samples),
+            self.logger,
+            "Metric collector failed",
+        )
+
+
+_metric_batchers: list = []
+
+
+def _reset_metric_batchers_after_fork():
+    """Drop samples buffered by the parent so a forked child never re-sends them."""
+    for batcher in _metric_batchers:
+        batcher.lock = threading.Lock()
+        batcher.samples = array("d")
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_metric_batchers_after_fork)
+
+
+@atexit.register
+def _flush_metric_batchers():
+    """Deliver partially filled metric batches at interpreter exit."""
+    # No new threads can start at shutdown, so run the collectors inline.
+    for batcher in _metric_batchers:
+        samples = batcher.take()
+        if samples:
+            _run_background(batcher._item(samples))
+
 
 @lru_cache(maxsize=1)
 def get_timing_logger():
@@ -14,64 +270,188 @@ def get_timing_logger():
     return build_logger("timing")
 
 
+def _level_gate(logger, level_no: int) -> Callable[[], bool]:
+    """
+    Build a check for whether ``logger`` currently emits ``level_no``.
+
+    The logger type is inspected once, so the returned callable is a single
+    comparison per timed call while still following later level changes.
+    """
+    # stdlib logging.Logger
+    is_enabled_for = getattr(logger, "isEnabledFor", None)
+    if is_enabled_for is not None:
+        return partial(is_enabled_for, level_no)
+    # loguru keeps the lowest level accepted by any handler on its core
+    core = getattr(logger, "_core", None)
+    if core is None:
+        return lambda: True
+    return lambda: level_no >= core.min_level
+
+
+# Call sites are reported relative to the directory the process started in.
+_CWD = os.getcwd()
+
+
+@lru_cache(maxsize=4096)
+def _relpath(fname: str) -> str:
+    """Relative display path for a source file, computed once per file."""
+    return os.path.relpath(fname, start=_CWD)
+
+
+# co_filename -> whether frames from that file count as the user's call site
+_user_frame_cache: Dict[str, bool] = {}
+
+
+def _is_user_frame(fname: str) -> bool:
+    """Classify a source file as user code (not timing/library/asyncio)."""
+    is_user = (
+        fname != __file__
+        and "site-packages" not in fname
+        and "asyncio" not in fname
+        and not fname.startswith("<")
+    )
+    _user_frame_cache[fname] = is_user
+    return is_user
+
+
 def _find_call_site():
-    """Find the frame of the actual function call (outside timing_v2)."""
+    """Find the frame of the actual function call (outside this module)."""
     frame = inspect.currentframe()
-    # move up: current (_find_call_site) → _log_time → wrapper → caller
+    # Start at our caller; the wrapper and helper frames between it and the
+    # user's code all live in this file and are skipped by _is_user_frame.
     if frame:
-        frame = frame.f_back.f_back.f_back
+        frame = frame.f_back
+    cached = _user_frame_cache.get
     while frame:
-        info = inspect.getframeinfo(frame)
-        fname = info.filename
-        if (
-            "timing_v2" not in fname
-            and "site-packages" not in fname
-            and "asyncio" not in fname
-            and not fname.startswith("<")
-        ):
-            rel_path = os.path.relpath(fname, start=os.getcwd())
-            return rel_path, info.lineno
+        fname = frame.f_code.co_filename
+        is_user = cached(fname)
+        if is_user is None:
+            is_user = _is_user_frame(fname)
+        if is_user:
+            return _relpath(fname), frame.f_lineno
         frame = frame.f_back
     return "unknown", -1
 
 
+def _format_label(name: str, tag) -> str:
+    """Build the fixed "[tag] module.qualname " part of a timing message."""
+    if tag:
+        if isinstance(tag, (list, tuple)):
+            tag_text = "[" + "|".join(map(str, tag)) + "] "
+        else:
+            tag_text = f"[{tag}] "
+    else:
+        tag_text = ""
+    return f"{tag_text}{name} "
+
+
+_WARNING_NO = LogLevel.WARNING.value
+
+# GNU_TIMING_DISABLED=1 strips measure_time at import/decoration time, so
+# perf-sensitive deployments keep the decorators in code at zero cost.
+_TIMING_DISABLED = os.getenv("GNU_TIMING_DISABLED", "").lower() in ("1", "true", "yes")
+
+# %-style templates for stdlib records: interpolation is left to
+# LogRecord.getMessage(), which runs in the handler on the background thread.
+_RECORD_MSG = "\033[92m[⏱ %7.3fs]\033[0m %s(\033[96m%s:%d\033[0m)"
+_RECORD_WARN_MSG = "\033[93m[⚠️ %7.3fs]\033[0m %s(\033[96m%s:%d\033[0m)"
+
+
+@lru_cache(maxsize=4096)
+def _format_ms(ms: int) -> str:
+    """Render a millisecond count as the 7.3f seconds field of a timing line."""
+    return f"{ms / 1000:7.3f}"
+
+
 def _log_time(
-    f,
-    start: float,
-    logger,
-    level: str,
-    tag: Optional[str],
+    label: str,
+    log: Callable[[str], None],
+    warn: Callable[[str], None],
     threshold_warning: Optional[float],
     elapsed: float,
     path: str,
     lineno: int,
 ):
     """Logs execution time with accurate call site info."""
-    module = inspect.getmodule(f)
-    modname = module.__name__ if module else "unknown"
-    qualname = getattr(f, "__qualname__", f.__name__)
-
-    emoji = "⚠️" if threshold_warning and elapsed > threshold_warning else "⏱"
-    color = "\033[93m" if emoji == "⚠️" else "\033[92m"
-
-    if tag:
-        if isinstance(tag, list | tuple):
-            tag_text = "[" + "|".join(map(str, tag)) + "] "
-        else:
-            tag_text = f"[{tag}] "
+    # Timing lines show milliseconds, so reuse the formatted field per value
+    # instead of running float formatting on every call.
+    seconds = _format_ms(int(elapsed * 1000 + 0.5))
+    if threshold_warning and elapsed > threshold_warning:
+        warn(f"\033[93m[⚠️ {seconds}s]\033[0m {label}(\033[96m{path}:{lineno}\033[0m)")
     else:
-        tag_text = ""
+        log(f"\033[92m[⏱ {seconds}s]\033[0m {label}(\033[96m{path}:{lineno}\033[0m)")
 
-    msg = (
-        f"{color}[{emoji} {elapsed:7.3f}s]\033[0m "
-        f"{tag_text}{modname}.{qualname} "
-        f"(\033[96m{path}:{lineno}\033[0m)"
-    )
 
+def _log_time_record(
+    label: str,
+    logger,
+    level_no: int,
+    func_name: str,
+    threshold_warning: Optional[float],
+    elapsed: float,
+    path: str,
+    lineno: int,
+):
+    """
+    Logs execution time through a stdlib logger without its caller lookup.
+
+    Logger.info() and friends run findCaller(), a second frame walk that would
+    only find this module anyway. The record is built directly with the call
+    site already resolved by _find_call_site. The logger's own filters run
+    here, in the caller's thread and context (e.g. request-id filters reading
+    contextvars); the record then carries its creation time, thread and call
+    site to the background timing thread, where the handlers (their filters,
+    formatting and IO) run. The message is stored as a template plus args and
+    only formatted there.
+    """
     if threshold_warning and elapsed > threshold_warning:
-        logger.warning(msg)
+        level_no = _WARNING_NO
+        msg = _RECORD_WARN_MSG
     else:
-        getattr(logger, level, logger.info)(msg)
+        msg = _RECORD_MSG
+    if not logger.isEnabledFor(level_no):
+        return
+    record = logger.makeRecord(
+        logger.name,
+        level_no,
+        path,
+        lineno,
+        msg,
+        (elapsed, label, path, lineno),
+        None,
+        func=func_name,
+    )
+    if logger.disabled:
+        return
+    # Logger.handle() minus callHandlers(); filters may return a new record
+    filtered = logger.filter(record)
+    if not filtered:
+        return
+    if isinstance(filtered, logging.LogRecord):
+        record = filtered
+    _submit_background(
+        logger.callHandlers, (record,), logger, "Failed to emit timing log"
+    )
+
+
+def _identity(f):
+    return f
+
+
+def _always() -> bool:
+    return True
+
+
+def _accepts_keywords(f) -> bool:
+    """Whether ``f`` could accept any keyword argument (True if unknown)."""
+    code = getattr(f, "__code__", None)
+    if code is None:
+        return True
+    return bool(
+        code.co_argcount > code.co_posonlyargcount
+        or code.co_kwonlyargcount
+        or code.co_flags & inspect.CO_VARKEYWORDS
+    )
 
 
 def measure_time(
@@ -88,13 +468,36 @@ def measure_time(
     record_to: Optional[str] = None,
     metric_collector: Optional[Callable[[str, float], None]] = None,
     tag: Optional[str] = None,
+    metric_batch_size: Optional[int] = None,
+    metric_flush_interval: float = 1.0,
 ):
     """
     Advanced timing decorator with logging, metrics, callbacks, and warnings.
 
+    Elapsed times are measured with the monotonic ``time.perf_counter_ns`` and
+    reported in seconds, so they are never negative or skewed by wall-clock
+    (NTP) adjustments; only JSONL record timestamps use ``time.time()``.
+
+    If only the log line is requested (no callback, collector, record file,
+    warning threshold or returned time), calls made while the logger drops
+    ``level`` skip timing entirely. The level is checked on every call, so
+    logging configured after decoration (e.g. at import) still takes effect.
+
+    Timing lines for stdlib loggers are handed to the logger's handlers on a
+    background thread, so they are not emitted synchronously: they can appear
+    after log lines written later by the caller, and tools that capture
+    records as they are emitted (e.g. pytest's ``caplog``) may need to wait
+    for them. Logger-level filters still run in the calling thread.
+
+    Setting the ``GNU_TIMING_DISABLED=1`` environment variable before import
+    turns every ``measure_time`` into a no-op that returns the function as is
+    (callbacks, metrics and records included), except where
+    ``is_return_measured_time`` is set, since callers expect a tuple there.
+
     Args:
         logger: Optional custom logger. Default = cached timing logger.
-        is_async: Set True for async functions.
+        is_async: Force the async wrapper. Coroutine functions are detected
+            automatically; set this for other callables returning awaitables.
         level: Log level for normal timing logs.
         is_return_measured_time: If True, returns (result, elapsed_time).
         threshold_warning: Log warning if elapsed_time > threshold (seconds).
@@ -102,81 +505,162 @@ def measure_time(
         record_to: Path to JSONL file for structured timing logs.
         metric_collector: Function to collect (func_name, elapsed_time) metrics.
         tag: Optional label for grouping logs (e.g., "db", "ml", "api").
+        metric_batch_size: If set, metric_collector receives
+            (func_name, array('d') of elapsed times) once this many samples are
+            buffered, instead of one call per timed call.
+        metric_flush_interval: Max seconds a batched sample waits; checked when
+            samples arrive, with leftovers flushed at exit.
 
     """
+    if _TIMING_DISABLED and not is_return_measured_time:
+        return func if func is not None else _identity
 
     def decorator(f):
-        nonlocal logger
-        logger = logger or get_timing_logger()
+        timing_logger = logger or get_timing_logger()
 
-        def _record_metrics_and_logs(
-            start, result, args, kwargs, elapsed, path, lineno
-        ):
-            # log to console/file
-            _log_time(
-                f, start, logger, level, tag, threshold_warning, elapsed, path, lineno
+        # Function metadata is fixed, so resolve it once instead of per call.
+        module = inspect.getmodule(f)
+        modname = module.__name__ if module else "unknown"
+        qualname = getattr(f, "__qualname__", f.__name__)
+        label = _format_label(f"{modname}.{qualname}", tag)
+        log = getattr(timing_logger, level, timing_logger.info)
+        warn = timing_logger.warning
+
+        # stdlib loggers get pre-built records; loguru and others get messages
+        use_records = hasattr(timing_logger, "makeRecord")
+        if use_records:
+            # stdlib's own names, so aliases like "warn" and "fatal" resolve
+            level_no = logging.getLevelNamesMapping().get(level.upper())
+            # names without a number (e.g. "exception") go through ``log``
+            use_records = level_no is not None
+        else:
+            try:
+                level_no = LogLevel.from_string(level).value
+            except ValueError:
+                level_no = None
+
+        # With nothing but the log line to produce, calls whose level the
+        # logger drops skip timing and call-site lookup (checked per call).
+        # Unresolved level names leave the level check to ``log`` itself.
+        if level_no is not None:
+            level_enabled = _level_gate(timing_logger, level_no)
+        else:
+            level_enabled = _always
+        can_skip = level_no is not None and not (
+            is_return_measured_time
+            or threshold_warning is not None
+            or on_complete_callback
+            or metric_collector
+            or record_to
+        )
+
+        batcher = None
+        if metric_collector and metric_batch_size:
+            batcher = _MetricBatcher(
+                metric_collector,
+                qualname,
+                timing_logger,
+                metric_batch_size,
+                metric_flush_interval,
             )
+            _metric_batchers.append(batcher)
+
+        def _record_metrics_and_logs(args, kwargs, elapsed):
+            # Only format the message (and walk the stack) when a sink will
+            # take it; threshold warnings are always attempted.
+            should_log = (
+                threshold_warning and elapsed > threshold_warning
+            ) or level_enabled()
+            if should_log or record_to:
+                path, lineno = _find_call_site()
+
+            # log to console/file
+            if should_log and use_records:
+                _log_time_record(
+                    label,
+                    timing_logger,
+                    level_no,
+                    qualname,
+                    threshold_warning,
+                    elapsed,
+                    path,
+                    lineno,
+                )
+            elif should_log:
+                _log_time(label, log, warn, threshold_warning, elapsed, path, lineno)
 
             # optional: callback
             if on_complete_callback:
                 try:
                     on_complete_callback(f, args, kwargs, elapsed)
                 except Exception as e:
-                    logger.warning(f"[timing_v2] Callback failed: {e}")
+                    timing_logger.warning(f"[timing_v2] Callback failed: {e}")
 
             # optional: metric collector
-            if metric_collector:
-                try:
-                    metric_collector(f.__qualname__, elapsed)
-                except Exception as e:
-                    logger.warning(f"[timing_v2] Metric collector failed: {e}")
+            if batcher is not None:
+                batcher.add(elapsed)
+            elif metric_collector:
+                _submit_background(
+                    metric_collector,
+                    (qualname, elapsed),
+                    timing_logger,
+                    "Metric collector failed",
+                )
 
             # optional: structured record
             if record_to:
                 try:
-                    with open(record_to, "a", encoding="utf-8") as fp:
-                        json.dump(
-                            {
-                                "function": f.__qualname__,
-                                "elapsed": elapsed,
-                                "tag": tag,
-                                "path": path,
-                                "lineno": lineno,
-                                "timestamp": time.time(),
-                            },
-                            fp,
-                            ensure_ascii=False,
-                        )
-                        fp.write("\n")
+                    record = {
+                        "function": qualname,
+                        "elapsed": elapsed,
+                        "tag": tag,
+                        "path": path,
+                        "lineno": lineno,
+                        "timestamp": time.time(),
+                    }
+                    _write_record(record_to, _dumps_record(record))
                 except Exception as e:
-                    logger.warning(f"[timing_v2] Failed to record log: {e}")
+                    timing_logger.warning(f"[timing_v2] Failed to record log: {e}")
 
-        if is_async:
+        if is_async or inspect.iscoroutinefunction(f):
 
             @wraps(f)
             async def async_wrapper(*args, **kwargs):
-                start = time.time()
+                if can_skip and not level_enabled():
+                    return await f(*args, **kwargs)
+                start = _perf_counter_ns()
                 result = await f(*args, **kwargs)
-                elapsed = time.time() - start
-                path, lineno = _find_call_site()
-                _record_metrics_and_logs(
-                    start, result, args, kwargs, elapsed, path, lineno
-                )
+                elapsed = (_perf_counter_ns() - start) / 1e9
+                _record_metrics_and_logs(args, kwargs, elapsed)
                 return (result, elapsed) if is_return_measured_time else result
 
             return async_wrapper
 
+        elif not _accepts_keywords(f):
+            # f takes no parameters or only positional-only ones, so keyword
+            # calls fail either way; skipping **kwargs avoids a dict per call.
+            @wraps(f)
+            def sync_wrapper(*args):
+                if can_skip and not level_enabled():
+                    return f(*args)
+                start = _perf_counter_ns()
+                result = f(*args)
+                elapsed = (_perf_counter_ns() - start) / 1e9
+                _record_metrics_and_logs(args, {}, elapsed)
+                return (result, elapsed) if is_return_measured_time else result
+
+            return sync_wrapper
+
         else:
 
             @wraps(f)
             def sync_wrapper(*args, **kwargs):
-                start = time.time()
+                if can_skip and not level_enabled():
+                    return f(*args, **kwargs)
+                start = _perf_counter_ns()
                 result = f(*args, **kwargs)
-                elapsed = time.time() - start
-                path, lineno = _find_call_site()
-                _record_metrics_and_logs(
-                    start, result, args, kwargs, elapsed, path, lineno
-                )
+                elapsed = (_perf_counter_ns() - start) / 1e9
+                _record_metrics_and_logs(args, kwargs, elapsed)
                 return (result, elapsed) if is_return_measured_time else result
 
             return sync_wrapper
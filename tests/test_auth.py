@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+from argon2 import PasswordHasher
+
+import general_utils.auth.auth as auth_module
+from general_utils.auth import (
+    ahash_password,
+    averify_credential,
+    hash_token,
+    set_password_hasher,
+    verify_credential,
+    verify_token,
+)
+
+
+@pytest.fixture
+def fast_hasher():
+    """Use a cheap Argon2 configuration and restore the shared one afterwards."""
+    previous = auth_module._PH
+    set_password_hasher(PasswordHasher(time_cost=1, memory_cost=8, parallelism=1))
+    yield
+    set_password_hasher(previous)
+
+
+def test_hash_token_is_keyed_and_deterministic():
+    """The same token and key always give the same MAC; other keys do not."""
+    key = b"server-secret"
+    assert hash_token("token-123", key) == hash_token("token-123", key)
+    assert hash_token("token-123", key) != hash_token("token-124", key)
+    assert hash_token("token-123", key) != hash_token("token-123", b"other")
+    assert len(hash_token("token-123", key)) == 64
+
+
+def test_verify_token():
+    """verify_token accepts the matching token and rejects anything else."""
+    key = b"server-secret"
+    stored = hash_token("token-123", key)
+    assert verify_token("token-123", key, stored)
+    assert not verify_token("token-124", key, stored)
+    assert not verify_token("token-123", b"other", stored)
+
+
+def test_async_password_round_trip(fast_hasher):
+    """The async helpers hash and verify like the sync ones."""
+
+    async def round_trip():
+        hashed = await ahash_password("hunter2")
+        return (
+            hashed,
+            await averify_credential("hunter2", hashed),
+            await averify_credential("hunter3", hashed),
+        )
+
+    hashed, ok, wrong = asyncio.run(round_trip())
+    assert hashed.startswith("$argon2")
+    assert ok is True
+    assert wrong is False
+    assert verify_credential("hunter2", hashed)
+
+
+def test_set_password_hasher_is_used(fast_hasher):
+    """Hashes carry the parameters of the configured hasher."""
+    hashed = asyncio.run(ahash_password("hunter2"))
+    assert "m=8,t=1,p=1" in hashed
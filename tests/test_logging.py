@@ -5,6 +5,9 @@ Test script for the enhanced logging functionality.
 
 import time
 
+import loguru
+
+from general_utils.utils import log_common
 from general_utils.utils.log_common import LogLevel, LogRotationConfig, build_logger
 
 
@@ -64,12 +67,49 @@ def test_log_levels():
     print("✓ Log levels test completed")
 
 
+def test_log_level_from_string():
+    """Test LogLevel parsing from names, values and members."""
+    assert LogLevel.from_string("info") is LogLevel.INFO
+    assert LogLevel.from_string("WARNING") is LogLevel.WARNING
+    assert LogLevel.from_string(10) is LogLevel.DEBUG
+    assert LogLevel.from_string(LogLevel.ERROR) is LogLevel.ERROR
+
+    for invalid in ("verbose", 7):
+        try:
+            LogLevel.from_string(invalid)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"{invalid!r} should be rejected")
+
+
+def test_handlers_reused_and_restored():
+    """Unchanged handlers are kept; handlers removed elsewhere are re-added."""
+    build_logger("test_reuse_a", log_path="./logs")
+    console_id = log_common._installed_handlers["console"][1]
+    file_id = log_common._installed_handlers["file"][1]
+
+    # Same console config, different file: only the file handler is replaced
+    build_logger("test_reuse_b", log_path="./logs")
+    assert log_common._installed_handlers["console"][1] == console_id
+    assert log_common._installed_handlers["file"][1] != file_id
+
+    loguru.logger.remove()
+    build_logger("test_reuse_c", log_path="./logs")
+    handlers = loguru.logger._core.handlers
+    assert log_common._installed_handlers["console"][1] in handlers
+    assert log_common._installed_handlers["file"][1] in handlers
+    assert len(handlers) == 2
+
+
 if __name__ == "__main__":
     print("Starting logging tests...")
 
     test_basic_logging()
     test_enhanced_logging()
     test_log_levels()
+    test_log_level_from_string()
+    test_handlers_reused_and_restored()
 
     print("\n✓ All tests completed successfully!")
     print("\nCheck the 'logs' directory for generated log files.")
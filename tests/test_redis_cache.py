@@ -0,0 +1,235 @@
+import asyncio
+
+import pytest
+
+from general_utils.caching import redis_fastapi
+from general_utils.caching.redis_fastapi import RedisCache
+
+
+class _StubPipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def setex(self, key, ttl, value):
+        self._commands.append((key, ttl, value))
+
+    async def execute(self):
+        for key, ttl, value in self._commands:
+            await self._redis.setex(key, ttl, value)
+        self._commands.clear()
+
+
+class _StubRedis:
+    """In-memory stand-in for the redis.asyncio calls RedisCache makes."""
+
+    def __init__(self):
+        self.strings = {}
+        self.hashes = {}
+        self.ttls = {}
+        self.reads = 0
+
+    async def get(self, key):
+        self.reads += 1
+        return self.strings.get(key)
+
+    async def hget(self, key, field):
+        self.reads += 1
+        return self.hashes.get(key, {}).get(field)
+
+    async def setex(self, key, ttl, value):
+        self.strings[key] = bytes(value)
+        self.ttls[key] = ttl
+
+    async def delete(self, *keys):
+        deleted = 0
+        for key in keys:
+            found = self.strings.pop(key, None) or self.hashes.pop(key, None)
+            self.ttls.pop(key, None)
+            deleted += found is not None
+        return deleted
+
+    def pipeline(self, transaction=True):
+        return _StubPipeline(self)
+
+    def register_script(self, script):
+        # Only the group write script is registered: HSET, then EXPIRE if no TTL
+        async def run(keys, args):
+            field, payload, ttl = args
+            self.hashes.setdefault(keys[0], {})[field] = bytes(payload)
+            self.ttls.setdefault(keys[0], ttl)
+
+        return run
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def stub_redis(monkeypatch):
+    """Make RedisCache.init() connect to a fresh in-memory stub."""
+    stub = _StubRedis()
+
+    async def from_url(url):
+        return stub
+
+    monkeypatch.setattr(redis_fastapi.redis, "from_url", from_url)
+    return stub
+
+
+def _make_cache(**kwargs) -> RedisCache:
+    cache = RedisCache("redis://stub", prefix="t", default_expire=30, **kwargs)
+    asyncio.run(cache.init())
+    return cache
+
+
+def _counting(value):
+    calls = []
+
+    async def endpoint():
+        calls.append(1)
+        return value
+
+    return endpoint, calls
+
+
+def test_cache_response_stores_in_redis(stub_redis):
+    """A second call is served from Redis instead of calling the endpoint."""
+    cache = _make_cache()
+    endpoint, calls = _counting({"answer": 42})
+    cached = cache.cache_response(key="answer")(endpoint)
+
+    assert asyncio.run(cached()) == {"answer": 42}
+    assert asyncio.run(cached()) == {"answer": 42}
+    assert len(calls) == 1
+    assert stub_redis.strings["t:answer"] == b'{"answer":42}'
+    assert stub_redis.ttls["t:answer"] == 30
+
+
+def test_local_cache_skips_redis(stub_redis):
+    """With an L1 cache, repeated hits never reach Redis."""
+    cache = _make_cache(local_max=8)
+    endpoint, calls = _counting([1, 2, 3])
+    cached = cache.cache_response(key="numbers")(endpoint)
+
+    for _ in range(3):
+        assert asyncio.run(cached()) == [1, 2, 3]
+    assert len(calls) == 1
+    assert stub_redis.reads == 1
+
+
+def test_local_cache_is_filled_from_redis(stub_redis):
+    """A Redis hit is copied into the L1 cache for later calls."""
+    stub_redis.strings["t:shared"] = b'"from redis"'
+    cache = _make_cache(local_max=8)
+    endpoint, calls = _counting("from endpoint")
+    cached = cache.cache_response(key="shared")(endpoint)
+
+    assert asyncio.run(cached()) == "from redis"
+    assert asyncio.run(cached()) == "from redis"
+    assert not calls
+    assert stub_redis.reads == 1
+
+
+def test_local_cache_without_redis():
+    """The L1 cache still works when Redis is unavailable."""
+    cache = RedisCache("redis://stub", prefix="t", local_max=8)
+    endpoint, calls = _counting("value")
+    cached = cache.cache_response(key="k")(endpoint)
+
+    assert asyncio.run(cached()) == "value"
+    assert asyncio.run(cached()) == "value"
+    assert len(calls) == 1
+
+
+def test_local_cache_evicts_least_recently_used():
+    """The L1 cache keeps at most local_max entries."""
+    local = redis_fastapi._LocalTTLCache(2)
+    local.set("a", b"1", 30)
+    local.set("b", b"2", 30)
+    assert local.get("a") == b"1"
+    local.set("c", b"3", 30)
+
+    assert local.get("b") is None
+    assert local.get("a") == b"1"
+    assert local.get("c") == b"3"
+
+
+def test_clear_cache_evicts_local_entry(stub_redis):
+    """clear_cache drops both the Redis key and the L1 entry."""
+    cache = _make_cache(local_max=8)
+    endpoint, calls = _counting("value")
+    cached = cache.cache_response(key="k")(endpoint)
+
+    asyncio.run(cached())
+    assert asyncio.run(cache.clear_cache("k")) == 1
+    asyncio.run(cached())
+    assert len(calls) == 2
+
+
+def test_group_entries_share_one_hash(stub_redis):
+    """Grouped entries live in one hash whose TTL is set by the first write."""
+    cache = _make_cache(local_max=8)
+    first, first_calls = _counting("first")
+    second, second_calls = _counting("second")
+    cached_first = cache.cache_response(key="a", group="users")(first)
+    cached_second = cache.cache_response(key="b", group="users", expire_seconds=300)(
+        second
+    )
+
+    assert asyncio.run(cached_first()) == "first"
+    assert asyncio.run(cached_second()) == "second"
+    assert stub_redis.hashes["t:h:users"] == {
+        "t:a": b'"first"',
+        "t:b": b'"second"',
+    }
+    assert stub_redis.ttls["t:h:users"] == 30
+    assert "t:a" not in stub_redis.strings
+
+    assert asyncio.run(cache.clear_group("users")) == 1
+    assert "t:h:users" not in stub_redis.hashes
+    assert asyncio.run(cached_first()) == "first"
+    assert asyncio.run(cached_second()) == "second"
+    assert len(first_calls) == len(second_calls) == 2
+
+
+def test_mset_cache_writes_through_local_cache(stub_redis):
+    """mset_cache replaces values in Redis and in the L1 cache."""
+    cache = _make_cache(local_max=8)
+    endpoint, calls = _counting("old")
+    cached = cache.cache_response(key="k")(endpoint)
+    assert asyncio.run(cached()) == "old"
+
+    asyncio.run(cache.mset_cache({"k": "new", "other": {"x": 1}}, 60))
+
+    assert asyncio.run(cached()) == "new"
+    assert len(calls) == 1
+    assert stub_redis.strings["t:k"] == b'"new"'
+    assert stub_redis.strings["t:other"] == b'{"x":1}'
+    assert stub_redis.ttls["t:other"] == 60
+
+
+def test_clear_all_cache_evicts_matching_local_entries():
+    """clear_all_cache drops matching L1 entries even without Redis."""
+    cache = RedisCache("redis://stub", prefix="t", local_max=8)
+    asyncio.run(cache.mset_cache({"user:1": 1, "user:2": 2, "item:1": 3}))
+
+    asyncio.run(cache.clear_all_cache("user:*"))
+
+    assert cache._local.get("t:user:1") is None
+    assert cache._local.get("t:user:2") is None
+    assert cache._local.get("t:item:1") == b"3"
+
+
+def test_hash_body_handles_big_ints():
+    """Bodies orjson rejects are hashed through the stdlib encoder."""
+    cache = RedisCache("redis://stub")
+    assert cache._hash_body({"x": 2**70}) == cache._hash_body({"x": 2**70})
+    assert cache._hash_body({"x": 2**70}) != cache._hash_body({"x": 2**70 + 1})
+    assert cache._hash_body({"a": 1, "b": 2}) == cache._hash_body({"b": 2, "a": 1})
@@ -0,0 +1,33 @@
+import json
+from collections import deque
+
+from general_utils.utils.serialization import _serialize_to_json
+
+
+def test_containers_serialize_as_lists():
+    """Sets and re-iterable containers are encoded as JSON arrays."""
+    data = {"range": range(3), "deque": deque([1, 2]), "set": {5}}
+    assert json.loads(_serialize_to_json(data)) == {
+        "range": [0, 1, 2],
+        "deque": [1, 2],
+        "set": [5],
+    }
+
+
+def test_iterators_are_not_consumed():
+    """Generators and iterators are not drained by serialization."""
+    generator = (i for i in range(3))
+    iterator = iter([1, 2, 3])
+
+    text = _serialize_to_json({"gen": generator, "it": iterator})
+
+    assert list(generator) == [0, 1, 2]
+    assert list(iterator) == [1, 2, 3]
+    encoded = json.loads(text)
+    assert encoded["gen"].startswith("<generator object")
+    assert encoded["it"].startswith("<list_iterator object")
+
+
+def test_big_ints_fall_back_to_stdlib():
+    """Values orjson rejects are still encoded."""
+    assert json.loads(_serialize_to_json({"x": 2**70})) == {"x": 2**70}
@@ -1,9 +1,17 @@
 import asyncio
+import contextvars
+import logging  # noqa: TID251
+import os
+import time
 
+import pytest
+
+from general_utils.utils import timing
 from general_utils.utils.timing import measure_time
 
 
 def my_callback(func, args, kwargs, elapsed):  # noqa: D103
+    assert elapsed >= 0
     print(f"[CALLBACK] {func.__name__} = {elapsed:.3f}s")
 
 
@@ -19,8 +27,6 @@ def my_metric_collector(name, elapsed):  # noqa: D103
     is_return_measured_time=True,
 )
 def slow_task(x):  # noqa: D103
-    import time
-
     time.sleep(x)
     return x * 2
 
@@ -37,9 +43,200 @@ async def slow_async(x):  # noqa: D103
     return x * 3
 
 
+def my_batch_collector(name, samples):  # noqa: D103
+    print(f"[BATCH] {name} -> {len(samples)} samples, max {max(samples):.3f}s")
+
+
+@measure_time(metric_collector=my_batch_collector, metric_batch_size=3)
+def fast_task(x):  # noqa: D103
+    return x + 1
+
+
 async def main():  # noqa: D103
     print(slow_task(0.7))
     print(await slow_async(1.0))
+    for i in range(3):
+        fast_task(i)
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def _capture_logger(name):
+    records = []
+
+    class _ListHandler(logging.Handler):
+        def emit(self, record):
+            records.append(record)
+
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.handlers = [_ListHandler()]
+    return logger, records
+
+
+def test_returns_result_and_elapsed():
+    """is_return_measured_time yields (result, elapsed) for sync and async."""
+
+    @measure_time(is_return_measured_time=True)
+    def double(x):
+        time.sleep(0.02)
+        return x * 2
+
+    @measure_time(is_return_measured_time=True)
+    async def triple(x):
+        await asyncio.sleep(0.02)
+        return x * 3
+
+    result, elapsed = double(2)
+    assert result == 4
+    assert 0.02 <= elapsed < 1.0
+
+    result, elapsed = asyncio.run(triple(2))
+    assert result == 6
+    assert 0.02 <= elapsed < 1.0
+
+
+def test_callback_and_metric_values():
+    """Callback and collector values are checked here, not in their threads."""
+    calls = []
+    metrics = []
+
+    @measure_time(
+        on_complete_callback=lambda *call: calls.append(call),
+        metric_collector=lambda name, elapsed: metrics.append((name, elapsed)),
+        is_return_measured_time=True,
+    )
+    def add(x, y=1):
+        return x + y
+
+    result, elapsed = add(1, y=2)
+    assert result == 3
+    assert len(calls) == 1
+    func, args, kwargs, callback_elapsed = calls[0]
+    assert func.__name__ == "add"
+    assert args == (1,)
+    assert kwargs == {"y": 2}
+    assert callback_elapsed == elapsed >= 0
+
+    assert _wait_for(lambda: len(metrics) == 1)
+    name, metric_elapsed = metrics[0]
+    assert name.endswith("add")
+    assert metric_elapsed == elapsed
+
+
+def test_metric_batches_flush_at_size_and_exit():
+    """Full batches reach the collector; leftovers are flushed at exit."""
+    batches = []
+
+    @measure_time(
+        metric_collector=lambda name, samples: batches.append(list(samples)),
+        metric_batch_size=3,
+        metric_flush_interval=60.0,
+    )
+    def inc(x):
+        return x + 1
+
+    for i in range(5):
+        assert inc(i) == i + 1
+
+    assert _wait_for(lambda: len(batches) == 1)
+    assert len(batches[0]) == 3
+    assert min(batches[0]) >= 0
+
+    timing._flush_metric_batchers()
+    assert len(batches) == 2
+    assert len(batches[1]) == 2
+
+
+def test_level_lowered_after_decoration_is_honoured():
+    """Logging configured after import-time decoration still times calls."""
+    logger, records = _capture_logger("timing-late-config-test")
+    logger.setLevel(logging.WARNING)
+
+    @measure_time(logger=logger)
+    def work():
+        return 1
+
+    assert hasattr(work, "__wrapped__")
+    assert work() == 1
+    logger.setLevel(logging.INFO)
+    assert work() == 1
+    assert _wait_for(lambda: len(records) == 1)
+    assert records[0].levelno == logging.INFO
+
+
+@pytest.mark.parametrize(
+    ("level", "levelno"),
+    [("warn", logging.WARNING), ("fatal", logging.CRITICAL), ("debug", logging.DEBUG)],
+)
+def test_stdlib_level_aliases(level, levelno):
+    """Level names stdlib understands are logged at stdlib's number for them."""
+    logger, records = _capture_logger(f"timing-level-{level}-test")
+    logger.setLevel(logging.DEBUG)
+
+    @measure_time(logger=logger, level=level)
+    def work():
+        return 1
+
+    work()
+    assert _wait_for(lambda: len(records) == 1)
+    assert records[0].levelno == levelno
+
+
+def test_logger_filters_run_in_calling_context():
+    """Logger filters see the caller's contextvars, not the worker's."""
+    request_id = contextvars.ContextVar("request_id", default="-")
+    logger, records = _capture_logger("timing-filter-context-test")
+
+    def add_request_id(record):
+        record.request_id = request_id.get()
+        return True
+
+    logger.filters = [add_request_id]
+
+    @measure_time(logger=logger)
+    def work():
+        return 1
+
+    request_id.set("abc")
+    work()
+    assert _wait_for(lambda: len(records) == 1)
+    assert records[0].request_id == "abc"
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_stdlib_records_arrive_after_fork():
+    """Stdlib timing records are still emitted by a child forked after use."""
+    logger, records = _capture_logger("timing-fork-test")
+
+    @measure_time(logger=logger)
+    def ping():
+        return 1
+
+    ping()
+    assert _wait_for(lambda: len(records) == 1)
+    assert records[0].getMessage().endswith(")")
+
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            ping()
+            if _wait_for(lambda: len(records) == 2):
+                code = 0
+        finally:
+            os._exit(code)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,175 @@
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry import trace  # noqa: E402
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (  # noqa: E402
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import StatusCode  # noqa: E402
+
+from general_utils.trace.otel import (  # noqa: E402
+    SpanProcessor,
+    _RoundRobinSpanProcessor,
+)
+
+
+def _make_processor(max_attr_length=8192):
+    # SpanProcessor() installs the global provider and OTLP exporters; tests
+    # only need log_trace, so give it a tracer exporting to memory instead.
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    processor = object.__new__(SpanProcessor)
+    processor.service_name = "test"
+    processor.max_attr_length = max_attr_length
+    processor._tracer = provider.get_tracer("test")
+    return processor, exporter
+
+
+def _spans_by_name(exporter):
+    return {span.name: span for span in exporter.get_finished_spans()}
+
+
+def test_span_records_input_and_output():
+    """log_trace records serialized arguments and the return value."""
+    processor, exporter = _make_processor()
+
+    @processor.log_trace("add")
+    def add(x, y=0):
+        return x + y
+
+    assert add(1, y=2) == 3
+    (span,) = exporter.get_finished_spans()
+    assert span.name == "add"
+    assert json.loads(span.attributes["langfuse.observation.input"]) == {
+        "args": [1],
+        "kwargs": {"y": 2},
+    }
+    assert span.attributes["langfuse.observation.output"] == "3"
+
+
+def test_span_is_current_and_restored():
+    """The span is current while the function runs and detached afterwards."""
+    processor, exporter = _make_processor()
+    seen = []
+
+    @processor.log_trace("work")
+    def work():
+        seen.append(trace.get_current_span())
+
+    work()
+    (span,) = exporter.get_finished_spans()
+    assert seen[0].get_span_context().span_id == span.context.span_id
+    assert trace.get_current_span() is trace.INVALID_SPAN
+
+
+def test_nested_spans_get_parent():
+    """Spans started inside a traced function, including tasks, are children."""
+    processor, exporter = _make_processor()
+
+    @processor.log_trace("inner")
+    def inner():
+        return "inner"
+
+    @processor.log_trace("task")
+    async def task():
+        return "task"
+
+    @processor.log_trace("outer")
+    async def outer():
+        inner()
+        return await asyncio.create_task(task())
+
+    assert asyncio.run(outer()) == "task"
+    spans = _spans_by_name(exporter)
+    outer_id = spans["outer"].context.span_id
+    assert spans["inner"].parent.span_id == outer_id
+    assert spans["task"].parent.span_id == outer_id
+    assert spans["outer"].parent is None
+
+
+def test_exception_is_recorded():
+    """Failures set an error status and are logged as the output."""
+    processor, exporter = _make_processor()
+
+    @processor.log_trace("fail")
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        fail()
+    (span,) = exporter.get_finished_spans()
+    assert span.status.status_code is StatusCode.ERROR
+    assert json.loads(span.attributes["langfuse.observation.output"]) == {
+        "error": "boom",
+        "error_type": "ValueError",
+    }
+    assert trace.get_current_span() is trace.INVALID_SPAN
+
+
+def test_long_attributes_are_truncated():
+    """Serialized attributes over max_attr_length end with a truncation marker."""
+    processor, exporter = _make_processor(max_attr_length=20)
+
+    @processor.log_trace("echo")
+    def echo(text):
+        return text
+
+    echo("x" * 100)
+    (span,) = exporter.get_finished_spans()
+    output = span.attributes["langfuse.observation.output"]
+    assert output == '"' + "x" * 19 + "...[truncated 82 chars]"
+    assert span.attributes["langfuse.observation.input"].startswith('{"args":')
+
+
+def test_truncation_can_be_disabled():
+    """max_attr_length=None keeps attributes whole."""
+    processor, exporter = _make_processor(max_attr_length=None)
+
+    @processor.log_trace("echo")
+    def echo(text):
+        return text
+
+    echo("x" * 10_000)
+    (span,) = exporter.get_finished_spans()
+    assert len(span.attributes["langfuse.observation.output"]) == 10_002
+
+
+def test_tags_keep_native_types():
+    """Primitive tag values are set as-is; other values are JSON encoded."""
+    processor, exporter = _make_processor()
+
+    @processor.log_trace("tagged", tag_names=["user", "count", "ratio", "flag", "meta"])
+    def tagged(**kwargs):
+        return None
+
+    tagged(user="alice", count=3, ratio=0.5, flag=True, meta={"k": [1, 2]})
+    (span,) = exporter.get_finished_spans()
+    assert span.attributes["tag.user"] == "alice"
+    assert span.attributes["tag.count"] == 3
+    assert span.attributes["tag.ratio"] == 0.5
+    assert span.attributes["tag.flag"] is True
+    assert json.loads(span.attributes["tag.meta"]) == {"k": [1, 2]}
+
+
+def test_round_robin_spreads_spans():
+    """Pooled processors each receive every Nth finished span."""
+    exporters = [InMemorySpanExporter(), InMemorySpanExporter()]
+    provider = TracerProvider()
+    provider.add_span_processor(
+        _RoundRobinSpanProcessor([SimpleSpanProcessor(e) for e in exporters])
+    )
+    tracer = provider.get_tracer("test")
+
+    for i in range(4):
+        tracer.start_span(f"span-{i}").end()
+
+    names = [[s.name for s in e.get_finished_spans()] for e in exporters]
+    assert names == [["span-0", "span-2"], ["span-1", "span-3"]]
+    assert provider.force_flush()